@@ -4,17 +4,13 @@ Demonstration of the Senior Developer Agent functionality
 """
 
 import asyncio
-import os
-import sys
-import warnings
+from typing import Tuple
 from dotenv import load_dotenv
 
 # Suppress warnings for clean output
-warnings.filterwarnings("ignore", category=UserWarning)
-warnings.filterwarnings("ignore", category=DeprecationWarning)
+from src.warning_suppression import suppress_warnings
 
-# Add the parent directory to the path so we can import from src
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+suppress_warnings()
 
 from src.crew_agents import SeniorDeveloperAgent
 from src.github_mcp_client import GitHubMCPClient, GitHubIssue
@@ -22,25 +18,12 @@ from src.github_mcp_client import GitHubMCPClient, GitHubIssue
 # Load environment variables
 load_dotenv()
 
-async def demo_senior_developer():
-    """Demonstrate the Senior Developer Agent functionality"""
-    
-    print("🤖 Senior Developer Agent - Demonstration")
-    print("=" * 60)
-    print("This demo shows how the Senior Developer Agent works:")
-    print("1. Reads AI tasks labeled as 'ai-task' from GitHub")
-    print("2. Analyzes task requirements and comments")
-    print("3. Implements solutions with clean, documented code")
-    print("4. Reviews code for quality and best practices")
-    print("5. Saves implementations to files")
-    print()
-    
-    # Mock AI tasks for demonstration
-    mock_ai_tasks = [
-        GitHubIssue(
-            number=123,
-            title="Implement sentiment analysis API",
-            body="""Create a REST API endpoint that performs sentiment analysis on text input.
+# Mock AI tasks for demonstration, built once at import
+_MOCK_AI_TASKS: Tuple[GitHubIssue, ...] = (
+    GitHubIssue(
+        number=123,
+        title="Implement sentiment analysis API",
+        body="""Create a REST API endpoint that performs sentiment analysis on text input.
             
 Requirements:
 - Accept POST requests with JSON payload containing 'text' field
@@ -60,16 +43,16 @@ Example response:
   "score": 0.85,
   "confidence": 0.92
 }""",
-            state="open",
-            labels=[{"name": "ai-task"}, {"name": "api"}],
-            created_at="2024-01-01T00:00:00Z",
-            updated_at="2024-01-01T00:00:00Z",
-            html_url="https://github.com/test/repo/issues/123"
-        ),
-        GitHubIssue(
-            number=124,
-            title="Create machine learning data preprocessing pipeline",
-            body="""Build a data preprocessing pipeline for machine learning projects.
+        state="open",
+        labels=[{"name": "ai-task"}, {"name": "api"}],
+        created_at="2024-01-01T00:00:00Z",
+        updated_at="2024-01-01T00:00:00Z",
+        html_url="https://github.com/test/repo/issues/123"
+    ),
+    GitHubIssue(
+        number=124,
+        title="Create machine learning data preprocessing pipeline",
+        body="""Build a data preprocessing pipeline for machine learning projects.
 
 Requirements:
 - Handle missing values and outliers
@@ -81,18 +64,33 @@ Requirements:
 - Unit tests for all functions
 
 The pipeline should be modular and reusable across different ML projects.""",
-            state="open",
-            labels=[{"name": "ai-task"}, {"name": "ml"}],
-            created_at="2024-01-01T00:00:00Z",
-            updated_at="2024-01-01T00:00:00Z",
-            html_url="https://github.com/test/repo/issues/124"
-        )
-    ]
+        state="open",
+        labels=[{"name": "ai-task"}, {"name": "ml"}],
+        created_at="2024-01-01T00:00:00Z",
+        updated_at="2024-01-01T00:00:00Z",
+        html_url="https://github.com/test/repo/issues/124"
+    )
+)
+
+async def demo_senior_developer():
+    """Demonstrate the Senior Developer Agent functionality"""
+    
+    print("🤖 Senior Developer Agent - Demonstration")
+    print("=" * 60)
+    print("This demo shows how the Senior Developer Agent works:")
+    print("1. Reads AI tasks labeled as 'ai-task' from GitHub")
+    print("2. Analyzes task requirements and comments")
+    print("3. Implements solutions with clean, documented code")
+    print("4. Reviews code for quality and best practices")
+    print("5. Saves implementations to files")
+    print()
+    
+    mock_ai_tasks = _MOCK_AI_TASKS
     
     print("📋 Mock AI Tasks Found:")
     for task in mock_ai_tasks:
         print(f"  • #{task.number}: {task.title}")
-        print(f"    Labels: {', '.join([label['name'] for label in task.labels])}")
+        print(f"    Labels: {task.label_names}")
         print(f"    State: {task.state}")
         print()
     
@@ -1,20 +1,19 @@
 #!/usr/bin/env python3
 """
 Basic usage example for AI Dev Agents
+
+Run from the project root so `src` resolves as a package:
+
+    python -m examples.basic_usage
 """
 
 import asyncio
-import os
-import sys
-import warnings
 from dotenv import load_dotenv
 
 # Suppress warnings for clean output
-warnings.filterwarnings("ignore", category=UserWarning)
-warnings.filterwarnings("ignore", category=DeprecationWarning)
+from src.warning_suppression import suppress_warnings
 
-# Add the parent directory to the path so we can import from src
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+suppress_warnings()
 
 from src.github_mcp_client import GitHubMCPClient
 from src.crew_agents import GitHubIssueAgent, SeniorDeveloperAgent
@@ -41,93 +40,90 @@ async def example_usage():
     
     mode = input("Enter your choice (1 or 2): ").strip()
     
-    if mode == "2":
-        # Senior Developer example
-        print(f"\n🤖 Senior Developer Agent - Example")
-        print("=" * 60)
-        print(f"Repository: {repository}")
-        print("Looking for issues labeled as 'ai-task'...")
-        print()
-        
-        try:
-            # Create MCP client
-            async with GitHubMCPClient(mcp_url) as mcp_client:
-                # Test connection
-                print("Testing connection to MCP server...")
-                
-                # Create Senior Developer Agent
-                print("🤖 Creating Senior Developer Agent...")
-                senior_dev_agent = SeniorDeveloperAgent(mcp_client)
-                
-                # Handle AI tasks
-                print("📊 Starting AI task handling...")
-                result = await senior_dev_agent.handle_ai_tasks(repository)
-                
-                print("\n" + "=" * 60)
-                print("AI TASK HANDLING RESULTS")
-                print("=" * 60)
-                print(result)
-                
-                # Save implementations if any code was generated
-                if "```" in result:
-                    print("\n" + "=" * 60)
-                    print("SAVING IMPLEMENTATIONS")
-                    print("=" * 60)
-                    save_result = senior_dev_agent.save_implementations(result)
-                    print(save_result)
-                
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            print("\n💡 Make sure the MCP server is running:")
-            print("   python main.py server")
-        return
-    
-    # Default mode - analyze issues by label
-    print(f"🔍 Analyzing issues with label '{label}' in {repository}")
-    print("=" * 60)
-    
     try:
-        # Create MCP client
+        # Create the MCP client once so both example modes share one
+        # connection pool; avoid instantiating clients inside hot loops.
         async with GitHubMCPClient(mcp_url) as mcp_client:
             # Test connection
             print("Testing connection to MCP server...")
             
-            # Get both filtered and total issues
-            issues = await mcp_client.get_issues_by_label(repository, label)
-            all_open_issues = await mcp_client.get_all_open_issues(repository)
-            
-            print(f"✅ Found {len(issues)} issues with label '{label}'")
-            print(f"📊 Total open issues: {len(all_open_issues)}")
-            if len(all_open_issues) > 0:
-                percentage = (len(issues) / len(all_open_issues) * 100)
-                print(f"📈 Percentage: {percentage:.1f}%")
-            print()
-            
-            if issues:
-                print("\n📋 Sample issues:")
-                for issue in issues[:3]:  # Show first 3 issues
-                    print(f"  • #{issue.number}: {issue.title}")
-                    print(f"    State: {issue.state}")
-                    print(f"    URL: {issue.html_url}")
-                    print()
-            
-            # Create Crew AI agent
-            print("🤖 Creating Crew AI agents...")
-            agent = GitHubIssueAgent(mcp_client)
-            
-            # Analyze issues
-            print("📊 Starting analysis...")
-            result = await agent.analyze_issues_by_label(repository, label)
-            
-            print("\n" + "=" * 60)
-            print("ANALYSIS RESULTS")
-            print("=" * 60)
-            print(result)
+            if mode == "2":
+                await senior_developer_example(mcp_client, repository)
+            else:
+                await label_analysis_example(mcp_client, repository, label)
             
     except Exception as e:
         print(f"❌ Error: {e}")
         print("\n💡 Make sure the MCP server is running:")
         print("   python main.py server")
 
+async def senior_developer_example(mcp_client: GitHubMCPClient, repository: str):
+    """Senior Developer example"""
+    print(f"\n🤖 Senior Developer Agent - Example")
+    print("=" * 60)
+    print(f"Repository: {repository}")
+    print("Looking for issues labeled as 'ai-task'...")
+    print()
+    
+    # Create Senior Developer Agent
+    print("🤖 Creating Senior Developer Agent...")
+    senior_dev_agent = SeniorDeveloperAgent(mcp_client)
+    
+    # Handle AI tasks
+    print("📊 Starting AI task handling...")
+    result, code_blocks = await senior_dev_agent.run_ai_tasks(repository)
+    
+    print("\n" + "=" * 60)
+    print("AI TASK HANDLING RESULTS")
+    print("=" * 60)
+    print(result)
+    
+    # Save implementations if any code was generated
+    if code_blocks:
+        print("\n" + "=" * 60)
+        print("SAVING IMPLEMENTATIONS")
+        print("=" * 60)
+        save_result = await senior_dev_agent.save_implementations(result, code_blocks=code_blocks)
+        print(save_result)
+
+async def label_analysis_example(mcp_client: GitHubMCPClient, repository: str, label: str):
+    """Default mode - analyze issues by label"""
+    print(f"🔍 Analyzing issues with label '{label}' in {repository}")
+    print("=" * 60)
+    
+    # Get both filtered and total issues
+    issues, all_open_issues = await asyncio.gather(
+        mcp_client.get_issues_by_label(repository, label),
+        mcp_client.get_all_open_issues(repository),
+    )
+    
+    print(f"✅ Found {len(issues)} issues with label '{label}'")
+    print(f"📊 Total open issues: {len(all_open_issues)}")
+    if len(all_open_issues) > 0:
+        percentage = (len(issues) / len(all_open_issues) * 100)
+        print(f"📈 Percentage: {percentage:.1f}%")
+    print()
+    
+    if issues:
+        print("\n📋 Sample issues:")
+        for issue in issues[:3]:  # Show first 3 issues
+            print(f"  • #{issue.number}: {issue.title}")
+            print(f"    State: {issue.state}")
+            print(f"    URL: {issue.html_url}")
+            print()
+    
+    # Create Crew AI agent
+    print("🤖 Creating Crew AI agents...")
+    agent = GitHubIssueAgent(mcp_client)
+    
+    # Analyze issues
+    print("📊 Starting analysis...")
+    result = await agent.analyze_issues_by_label(repository, label)
+    
+    print("\n" + "=" * 60)
+    print("ANALYSIS RESULTS")
+    print("=" * 60)
+    print(result)
+
 if __name__ == "__main__":
     asyncio.run(example_usage()) 
\ No newline at end of file
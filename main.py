@@ -3,8 +3,13 @@
 Main application for AI Dev Agents using Crew AI and GitHub MCP Server
 """
 
+import argparse
 import asyncio
+import functools
 import logging
+import os
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
 from dotenv import load_dotenv
 
 # Import warning suppression first
@@ -23,8 +28,17 @@ load_dotenv()
 configure_logging(level=logging.INFO, suppress_warnings_flag=True)
 logger = logging.getLogger(__name__)
 
-async def main():
-    """Main function to demonstrate the GitHub issue analysis"""
+@dataclass(frozen=True)
+class Config:
+    """Application configuration read from the environment"""
+    github_token: str
+    repository: str
+    openai_api_key: str
+    mcp_url: str
+
+@functools.lru_cache(maxsize=1)
+def load_config() -> Optional[Config]:
+    """Read and validate the environment once, returning None if incomplete"""
     
     # Check required environment variables
     github_token = os.getenv("GITHUB_TOKEN")
@@ -33,15 +47,15 @@ async def main():
     
     if not github_token:
         logger.error("GITHUB_TOKEN environment variable is required")
-        return
+        return None
     
     if not repository:
         logger.error("GITHUB_REPOSITORY environment variable is required (format: owner/repo)")
-        return
+        return None
     
     if not openai_api_key:
         logger.error("OPENAI_API_KEY environment variable is required")
-        return
+        return None
     
     # Set OpenAI API key for Crew AI
     os.environ["OPENAI_API_KEY"] = openai_api_key
@@ -49,120 +63,182 @@ async def main():
     # MCP server configuration
     mcp_host = os.getenv("MCP_SERVER_HOST", "localhost")
     mcp_port = int(os.getenv("MCP_SERVER_PORT", "3000"))
-    mcp_url = f"http://{mcp_host}:{mcp_port}"
     
-    print("🤖 AI Dev Agents - GitHub Issue Analysis")
+    return Config(
+        github_token=github_token,
+        repository=repository,
+        openai_api_key=openai_api_key,
+        mcp_url=f"http://{mcp_host}:{mcp_port}"
+    )
+
+async def handle_ai_tasks_mode(mcp_client: GitHubMCPClient, repository: str):
+    """Senior Developer mode - handle AI tasks"""
+    print(f"\n🤖 Senior Developer Agent - Handling AI Tasks")
     print("=" * 50)
     print(f"Repository: {repository}")
-    print(f"MCP Server: {mcp_url}")
+    print("Looking for issues labeled as 'ai-task'...")
+    print()
+    
+    # Create Senior Developer Agent
+    senior_dev_agent = SeniorDeveloperAgent(mcp_client)
+    
+    # Handle AI tasks
+    print("Starting Senior Developer analysis...")
+    result, code_blocks = await senior_dev_agent.run_ai_tasks(repository)
+    
+    print("\n" + "=" * 50)
+    print("AI TASK HANDLING RESULTS")
+    print("=" * 50)
+    print(result)
+    
+    # Save implementations if any code was generated
+    if code_blocks:
+        print("\n" + "=" * 50)
+        print("SAVING IMPLEMENTATIONS")
+        print("=" * 50)
+        save_result = await senior_dev_agent.save_implementations(result, code_blocks=code_blocks)
+        print(save_result)
+
+async def analyze_label_mode(mcp_client: GitHubMCPClient, repository: str, label: str):
+    """Default mode - analyze issues by label"""
+    print(f"\nAnalyzing issues with label '{label}' in {repository}...")
+    print()
+    
+    # Get both filtered and total issues
+    test_issues, all_open_issues = await asyncio.gather(
+        mcp_client.get_issues_by_label(repository, label),
+        mcp_client.get_all_open_issues(repository),
+    )
+    
+    print(f"📊 Repository Statistics:")
+    print(f"   Total open issues: {len(all_open_issues)}")
+    print(f"   Issues with label '{label}': {len(test_issues)}")
+    if len(all_open_issues) > 0:
+        percentage = (len(test_issues) / len(all_open_issues) * 100)
+        print(f"   Percentage: {percentage:.1f}%")
     print()
     
-    # Choose operation mode
+    # Create Crew AI agent
+    agent = GitHubIssueAgent(mcp_client)
+    
+    # Analyze issues
+    print("Starting Crew AI analysis...")
+    result = await agent.analyze_issues_by_label(repository, label)
+    
+    print("\n" + "=" * 50)
+    print("ANALYSIS RESULTS")
+    print("=" * 50)
+    print(result)
+
+def prompt_for_mode() -> Tuple[str, Optional[str]]:
+    """Ask for the operation mode (and label) before the event loop starts"""
     print("Choose operation mode:")
     print("1. Analyze issues by label")
     print("2. Handle AI tasks (senior developer)")
     print()
     
-    mode = input("Enter your choice (1 or 2): ").strip()
+    choice = input("Enter your choice (1 or 2): ").strip()
+    if choice == "2":
+        return "ai-tasks", None
     
-    if mode == "2":
-        # Senior Developer mode - handle AI tasks
-        print(f"\n🤖 Senior Developer Agent - Handling AI Tasks")
-        print("=" * 50)
-        print(f"Repository: {repository}")
-        print("Looking for issues labeled as 'ai-task'...")
-        print()
-        
-        try:
-            # Create MCP client
-            async with GitHubMCPClient(mcp_url) as mcp_client:
-                # Test connection to MCP server
-                print("Testing MCP server connection...")
-                
-                # Create Senior Developer Agent
-                senior_dev_agent = SeniorDeveloperAgent(mcp_client)
-                
-                # Handle AI tasks
-                print("Starting Senior Developer analysis...")
-                result = await senior_dev_agent.handle_ai_tasks(repository)
-                
-                print("\n" + "=" * 50)
-                print("AI TASK HANDLING RESULTS")
-                print("=" * 50)
-                print(result)
-                
-                # Save implementations if any code was generated
-                if "```" in result:
-                    print("\n" + "=" * 50)
-                    print("SAVING IMPLEMENTATIONS")
-                    print("=" * 50)
-                    save_result = senior_dev_agent.save_implementations(result)
-                    print(save_result)
-                
-        except Exception as e:
-            logger.error(f"Error in senior developer mode: {e}")
-            print(f"Error: {e}")
-            print("\nMake sure the MCP server is running with:")
-            print("python src/mcp_server.py")
+    label = input("Enter the label to filter issues by: ").strip()
+    return "analyze", label
+
+async def main(command: Optional[str] = None, label: Optional[str] = None):
+    """Main function to demonstrate the GitHub issue analysis"""
+    
+    config = load_config()
+    if config is None:
         return
     
-    # Default mode - analyze issues by label
-    label = input("Enter the label to filter issues by: ").strip()
-    if not label:
+    repository = config.repository
+    mcp_url = config.mcp_url
+    
+    print("🤖 AI Dev Agents - GitHub Issue Analysis")
+    print("=" * 50)
+    print(f"Repository: {repository}")
+    print(f"MCP Server: {mcp_url}")
+    print()
+    
+    if command is None:
+        command, label = prompt_for_mode()
+    
+    if command == "analyze" and not label:
         print("No label provided. Using 'bug' as default.")
         label = "bug"
     
-    print(f"\nAnalyzing issues with label '{label}' in {repository}...")
-    print()
+    # Create the MCP client once for the whole run so every mode shares the
+    # same connection pool; avoid instantiating clients inside hot loops
+    mcp_client = GitHubMCPClient(mcp_url)
     
     try:
-        # Create MCP client
-        async with GitHubMCPClient(mcp_url) as mcp_client:
-            # Test connection to MCP server
-            print("Testing MCP server connection...")
-            
-            # Get both filtered and total issues
-            test_issues = await mcp_client.get_issues_by_label(repository, label)
-            all_open_issues = await mcp_client.get_all_open_issues(repository)
-            
-            print(f"📊 Repository Statistics:")
-            print(f"   Total open issues: {len(all_open_issues)}")
-            print(f"   Issues with label '{label}': {len(test_issues)}")
-            if len(all_open_issues) > 0:
-                percentage = (len(test_issues) / len(all_open_issues) * 100)
-                print(f"   Percentage: {percentage:.1f}%")
-            print()
-            
-            # Create Crew AI agent
-            agent = GitHubIssueAgent(mcp_client)
-            
-            # Analyze issues
-            print("Starting Crew AI analysis...")
-            result = await agent.analyze_issues_by_label(repository, label)
-            
-            print("\n" + "=" * 50)
-            print("ANALYSIS RESULTS")
-            print("=" * 50)
-            print(result)
+        await mcp_client.__aenter__()
+        
+        # Test connection to MCP server
+        print("Testing MCP server connection...")
+        
+        if command == "ai-tasks":
+            await handle_ai_tasks_mode(mcp_client, repository)
+        else:
+            await analyze_label_mode(mcp_client, repository, label)
             
     except Exception as e:
-        logger.error(f"Error in main application: {e}")
+        if command == "ai-tasks":
+            logger.error("Error in senior developer mode: %s", e)
+        else:
+            logger.error("Error in main application: %s", e)
         print(f"Error: {e}")
         print("\nMake sure the MCP server is running with:")
         print("python src/mcp_server.py")
+    finally:
+        await mcp_client.__aexit__(None, None, None)
 
 async def run_mcp_server():
     """Run the MCP server"""
     from src.mcp_server import main as mcp_main
     await mcp_main()
 
-if __name__ == "__main__":
-    import sys
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse the command line; with no subcommand the mode is asked for interactively"""
+    parser = argparse.ArgumentParser(
+        description="AI Dev Agents - GitHub issue analysis with Crew AI"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    
+    subparsers.add_parser("server", help="Run the MCP server")
+    
+    analyze_parser = subparsers.add_parser("analyze", help="Analyze issues by label")
+    analyze_parser.add_argument("--label", default="bug", help="Label to filter issues by (default: bug)")
+    
+    subparsers.add_parser("ai-tasks", help="Handle AI tasks (senior developer)")
     
-    if len(sys.argv) > 1 and sys.argv[1] == "server":
+    return parser.parse_args(argv)
+
+def cli_main(argv: Optional[List[str]] = None):
+    """Command line entry point: resolve the mode before starting the event loop"""
+    args = parse_args(argv)
+    
+    # Use uvloop's faster event loop when available; fall back to the default
+    # asyncio loop where it isn't installed or supported (e.g. Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
+    if args.command == "server":
         # Run MCP server
         print("Starting MCP server...")
         asyncio.run(run_mcp_server())
     else:
+        # Ask for the mode before the event loop starts, so Ctrl+C at the
+        # prompt exits straight away
+        command, label = args.command, getattr(args, "label", None)
+        if command is None:
+            command, label = prompt_for_mode()
+        
         # Run main application
-        asyncio.run(main()) 
+        asyncio.run(main(command, label))
+
+if __name__ == "__main__":
+    cli_main()
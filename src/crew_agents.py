@@ -1,8 +1,11 @@
 import asyncio
+import hashlib
 import logging
 import json
 import re
-from typing import List, Dict, Any, Optional
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from crewai import Agent, Task, Crew
 from pydantic import BaseModel, Field
 
@@ -10,12 +13,235 @@ from .github_mcp_client import GitHubMCPClient, GitHubIssue
 
 logger = logging.getLogger(__name__)
 
+# Pattern to match markdown code blocks
+_CODE_BLOCK_RE = re.compile(r'```(\w+)?\n(.*?)```', re.DOTALL)
+
+# File extensions for the code block languages that are saved as files
+_EXT_MAP = {
+    'python': '.py',
+    'js': '.js',
+    'javascript': '.js',
+    'typescript': '.ts',
+    'java': '.java',
+    'cpp': '.cpp',
+    'c': '.c',
+    'go': '.go',
+    'rust': '.rs'
+}
+_SUPPORTED_LANGS = frozenset(_EXT_MAP)
+
+# Runs of characters that are not allowed in branch name slugs
+_SLUG_RE = re.compile(r'[^a-z0-9-]+')
+
+# Keywords used to classify AI task issues. Like a lowercase substring test,
+# they match case-insensitively anywhere in the title and body.
+_CODE_CHANGE_KEYWORDS = (
+    "implement", "create", "add", "fix", "update", "modify", "change",
+    "function", "class", "method", "api", "endpoint", "file", "code",
+    "script", "module", "library", "package", "component"
+)
+_INVALID_KEYWORDS = (
+    "invalid", "unclear", "not clear", "confusing", "wrong", "error",
+    "duplicate", "spam", "test", "example", "sample"
+)
+_COMPLETED_KEYWORDS = (
+    "done", "completed", "finished", "resolved", "fixed", "closed",
+    "implemented", "added", "created"
+)
+
+def _keyword_pattern(keywords) -> "re.Pattern":
+    """Compile keywords into a single case-insensitive alternation"""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords), re.IGNORECASE)
+
+_CODE_CHANGE_RE = _keyword_pattern(_CODE_CHANGE_KEYWORDS)
+_INVALID_RE = _keyword_pattern(_INVALID_KEYWORDS)
+_COMPLETED_RE = _keyword_pattern(_COMPLETED_KEYWORDS)
+
+# Issue categories in priority order, matched together in a single scan. The
+# lookahead reports keywords that overlap each other, so no match is hidden
+# by a longer keyword from another category.
+_CATEGORY_PRIORITY = ("code", "invalid", "completed")
+_CATEGORY_RE = re.compile(
+    "(?=" + "|".join(
+        f"(?P<{category}>" + "|".join(re.escape(keyword) for keyword in keywords) + ")"
+        for category, keywords in zip(
+            _CATEGORY_PRIORITY, (_CODE_CHANGE_KEYWORDS, _INVALID_KEYWORDS, _COMPLETED_KEYWORDS)
+        )
+    ) + ")",
+    re.IGNORECASE
+)
+
+class LLMResponseCache:
+    """In-process LRU cache with a TTL for Crew AI results keyed by the crew's inputs"""
+    
+    def __init__(self, ttl: float = 3600, max_entries: int = 128):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+    
+    @staticmethod
+    def make_key(llm_model: str, repository: str, label: str, issues: List[GitHubIssue],
+                 crew: str = "analysis", total_open: Optional[int] = None) -> str:
+        """
+        Build a cache key from the model and a fingerprint of the issues
+        
+        Args:
+            llm_model: LLM model used by the crew
+            repository: Repository in format 'owner/repo'
+            label: Label the issues were filtered by
+            issues: Issues passed to the crew
+            crew: Which crew produces the result, e.g. "analysis" or "ai_task"
+            total_open: Total open issue count, when it is part of the prompt
+            
+        Returns:
+            SHA-256 hex digest identifying the crew inputs
+        """
+        fingerprint = sorted((issue.number, issue.updated_at) for issue in issues)
+        payload = json.dumps({
+            "crew": crew,
+            "model": llm_model,
+            "repo": repository,
+            "label": label,
+            "total_open": total_open,
+            "fingerprint": fingerprint
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached result for key, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            logger.info("LLM cache hit (%s hits, %s misses)", self.hits, self.misses)
+            return entry[1]
+        
+        self._entries.pop(key, None)
+        self.misses += 1
+        logger.info("LLM cache miss (%s hits, %s misses)", self.hits, self.misses)
+        return None
+    
+    def set(self, key: str, value: Any):
+        """Store a result for key until the TTL expires, evicting the least recently used"""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+# Shared by all agents so repeated runs over unchanged issues skip the crew
+_llm_response_cache = LLMResponseCache()
+
+class IssueCache:
+    """Per-(repository, label) cache of issue lists, revalidated with ETags"""
+    
+    def __init__(self, ttl: float = 10):
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, str], Tuple[Optional[str], List[GitHubIssue], float]] = {}
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+    
+    async def get_issues_by_label(self, mcp_client: GitHubMCPClient, repository: str, label: str) -> List[GitHubIssue]:
+        """
+        Get issues by label, reusing fresh results and revalidating stale ones
+        
+        Args:
+            mcp_client: Client used to fetch the issues
+            repository: Repository in format 'owner/repo'
+            label: Label to filter by
+            
+        Returns:
+            List of GitHubIssue objects
+        """
+        key = (repository, label)
+        entry = self._entries.get(key)
+        
+        # Within the TTL the cached list is returned without a round trip
+        if entry is not None and entry[2] + self.ttl > time.monotonic():
+            return entry[1]
+        
+        # Concurrent callers for the same key share a single fetch
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        try:
+            async with lock:
+                return await self._fetch(mcp_client, key)
+        finally:
+            # Drop idle locks so they neither pile up nor outlive their event loop
+            if not lock.locked() and self._locks.get(key) is lock:
+                del self._locks[key]
+    
+    def invalidate(self, repository: str, label: str):
+        """Forget the cached issues for a label, e.g. after acting on them"""
+        self._entries.pop((repository, label), None)
+    
+    async def _fetch(self, mcp_client: GitHubMCPClient, key: Tuple[str, str]) -> List[GitHubIssue]:
+        """Fetch or revalidate the issues for a key while holding its lock"""
+        repository, label = key
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        
+        # Another caller may have refreshed the entry while we waited
+        if entry is not None and entry[2] + self.ttl > now:
+            return entry[1]
+        
+        etag = entry[0] if entry is not None else None
+        issues, new_etag = await mcp_client.get_issues_by_label_conditional(repository, label, etag)
+        
+        if issues is None:
+            if entry is None:
+                return []
+            # 304 Not Modified: the cached list is still current
+            self._entries[key] = (etag, entry[1], now)
+            return entry[1]
+        
+        # Only keep results that came with an ETag; failed fetches have none
+        if new_etag:
+            self._entries[key] = (new_etag, issues, now)
+        return issues
+
+class RateLimiter:
+    """Token bucket that spaces out calls to stay under GitHub's secondary rate limits"""
+    
+    def __init__(self, rate: float = 1.0, burst: int = 5):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
 class GitHubIssueAgent:
     """Crew AI agent for reading and analyzing GitHub issues"""
     
     def __init__(self, mcp_client: GitHubMCPClient, llm_model: str = "gpt-4"):
         self.mcp_client = mcp_client
         self.llm_model = llm_model
+        self._llm_cache = _llm_response_cache
+        self._issues_cache = IssueCache()
+        # Crew agents are created on first use and reused across runs
+        self._reader_agent: Optional[Agent] = None
+        self._analyst_agent: Optional[Agent] = None
     
     async def analyze_issues_by_label(self, repository: str, label: str) -> str:
         """
@@ -30,32 +256,64 @@ class GitHubIssueAgent:
         """
         try:
             # First, get the issues data
-            issues = await self.mcp_client.get_issues_by_label(repository, label)
-            all_open_issues = await self.mcp_client.get_all_open_issues(repository)
+            issues, all_open_issues = await asyncio.gather(
+                self._issues_cache.get_issues_by_label(self.mcp_client, repository, label),
+                self.mcp_client.get_all_open_issues(repository)
+            )
             
             if not issues:
                 return f"No issues found with label '{label}' in repository '{repository}'"
             
-            # Format the issues data with total counts
-            issues_data = f"Repository Overview: {repository}\n"
-            issues_data += f"Total open issues: {len(all_open_issues)}\n"
-            issues_data += f"Issues with label '{label}': {len(issues)}\n"
-            issues_data += f"Percentage of open issues with this label: {(len(issues) / len(all_open_issues) * 100):.1f}%\n\n"
-            issues_data += f"Detailed issues with label '{label}':\n\n"
+            # Reuse a previous analysis of exactly the same issues
+            cache_key = self._llm_cache.make_key(
+                self.llm_model, repository, label, issues,
+                crew="analysis", total_open=len(all_open_issues)
+            )
+            cached_result = self._llm_cache.get(cache_key)
+            if cached_result is not None:
+                return cached_result
             
+            # Format the issues data with total counts
+            parts = [
+                f"Repository Overview: {repository}",
+                f"Total open issues: {len(all_open_issues)}",
+                f"Issues with label '{label}': {len(issues)}"
+            ]
+            if all_open_issues:
+                parts.append(f"Percentage of open issues with this label: {(len(issues) / len(all_open_issues) * 100):.1f}%")
+            parts.append("")
+            parts.append(f"Detailed issues with label '{label}':")
+            parts.append("")
+            
+            separator = "-" * 50
             for issue in issues:
-                labels_str = ", ".join([label.get("name", "") for label in issue.labels])
-                issues_data += f"Issue #{issue.number}: {issue.title}\n"
-                issues_data += f"State: {issue.state}\n"
-                issues_data += f"Labels: {labels_str}\n"
-                issues_data += f"Created: {issue.created_at}\n"
-                issues_data += f"Updated: {issue.updated_at}\n"
-                issues_data += f"URL: {issue.html_url}\n"
-                issues_data += f"Body: {issue.body[:200]}{'...' if len(issue.body) > 200 else ''}\n"
-                issues_data += "-" * 50 + "\n"
-            
-            # Create agents for analysis
-            issue_reader_agent = Agent(
+                body = issue.body
+                ellipsis = "..." if len(body) > 200 else ""
+                parts.append(f"Issue #{issue.number}: {issue.title}")
+                parts.append(f"State: {issue.state}")
+                parts.append(f"Labels: {issue.label_names}")
+                parts.append(f"Created: {issue.created_at}")
+                parts.append(f"Updated: {issue.updated_at}")
+                parts.append(f"URL: {issue.html_url}")
+                parts.append(f"Body: {body[:200]}{ellipsis}")
+                parts.append(separator)
+            
+            issues_data = "\n".join(parts) + "\n"
+            
+            # Execute the crew in a worker thread; kickoff() blocks for the whole
+            # LLM pipeline and would otherwise stall the event loop
+            result = await asyncio.to_thread(self._run_analysis_crew, issues_data)
+            self._llm_cache.set(cache_key, result)
+            return result
+            
+        except Exception as e:
+            logger.error("Error in issue analysis: %s", e)
+            return f"Error analyzing issues: {str(e)}"
+    
+    def _get_reader_agent(self) -> Agent:
+        """Get the issue reader agent, creating it on first use"""
+        if self._reader_agent is None:
+            self._reader_agent = Agent(
                 role="GitHub Issue Reader",
                 goal="Read and collect GitHub issues from repositories filtered by labels",
                 backstory="""You are an expert at reading and understanding GitHub issues. 
@@ -65,8 +323,12 @@ class GitHubIssueAgent:
                 allow_delegation=False,
                 llm_model=self.llm_model
             )
-            
-            issue_analyst_agent = Agent(
+        return self._reader_agent
+    
+    def _get_analyst_agent(self) -> Agent:
+        """Get the issue analyst agent, creating it on first use"""
+        if self._analyst_agent is None:
+            self._analyst_agent = Agent(
                 role="Issue Analyst",
                 goal="Analyze GitHub issues to provide insights and recommendations",
                 backstory="""You are an expert analyst who can examine GitHub issues and provide 
@@ -76,53 +338,68 @@ class GitHubIssueAgent:
                 allow_delegation=False,
                 llm_model=self.llm_model
             )
-            
-            # Create tasks
-            read_task = Task(
-                description=f"""Analyze the following GitHub issues data and provide a comprehensive summary:
+        return self._analyst_agent
+    
+    def _run_analysis_crew(self, issues_data: str) -> str:
+        """Build the issue analysis crew and run it on the formatted issues data"""
+        issue_reader_agent = self._get_reader_agent()
+        issue_analyst_agent = self._get_analyst_agent()
+        
+        # Create tasks
+        read_task = Task(
+            description=f"""Analyze the following GitHub issues data and provide a comprehensive summary:
 
 {issues_data}
 
 Provide a detailed summary of the issues including their titles, states, labels, and key information.""",
-                agent=issue_reader_agent,
-                expected_output="A detailed summary of all issues with the specified label"
-            )
-            
-            analyze_task = Task(
-                description=f"""Based on the issues data provided, create insights about:
-                1. Issue distribution (open vs closed)
-                2. Common patterns in labels
-                3. Potential bottlenecks or areas of concern
-                4. Recommendations for issue management
-                
-                Provide actionable insights and suggestions for the team.""",
-                agent=issue_analyst_agent,
-                expected_output="Comprehensive analysis with insights and recommendations",
-                context=[read_task]
-            )
-            
-            # Create crew
-            crew = Crew(
-                agents=[issue_reader_agent, issue_analyst_agent],
-                tasks=[read_task, analyze_task],
-                verbose=True
-            )
-            
-            # Execute the crew
-            result = crew.kickoff()
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error in issue analysis: {e}")
-            return f"Error analyzing issues: {str(e)}"
+            agent=issue_reader_agent,
+            expected_output="A detailed summary of all issues with the specified label"
+        )
+        
+        analyze_task = Task(
+            description=f"""Based on the issues data provided, create insights about:
+            1. Issue distribution (open vs closed)
+            2. Common patterns in labels
+            3. Potential bottlenecks or areas of concern
+            4. Recommendations for issue management
+            
+            Provide actionable insights and suggestions for the team.""",
+            agent=issue_analyst_agent,
+            expected_output="Comprehensive analysis with insights and recommendations",
+            context=[read_task]
+        )
+        
+        # Create crew
+        crew = Crew(
+            agents=[issue_reader_agent, issue_analyst_agent],
+            tasks=[read_task, analyze_task],
+            verbose=True
+        )
+        
+        # Execute the crew
+        return crew.kickoff()
 
 
 class SeniorDeveloperAgent:
     """Crew AI agent for handling AI tasks as a senior developer"""
     
+    # Maximum number of issues acted on concurrently
+    MAX_CONCURRENT_ACTIONS = 8
+    # Sustained writes per second and burst size; GitHub throttles bursts of
+    # content-creating requests with secondary rate limits
+    WRITE_RATE = 1.0
+    WRITE_BURST = 5
+    
     def __init__(self, mcp_client: GitHubMCPClient, llm_model: str = "gpt-4"):
         self.mcp_client = mcp_client
         self.llm_model = llm_model
+        self._llm_cache = _llm_response_cache
+        self._issues_cache = IssueCache()
+        self._write_limiter = RateLimiter(self.WRITE_RATE, self.WRITE_BURST)
+        # Crew agents are created on first use and reused across runs
+        self._task_reader_agent: Optional[Agent] = None
+        self._senior_dev_agent: Optional[Agent] = None
+        self._code_reviewer_agent: Optional[Agent] = None
     
     async def handle_ai_tasks(self, repository: str) -> str:
         """
@@ -134,28 +411,51 @@ class SeniorDeveloperAgent:
         Returns:
             Task completion results as a string
         """
+        result, _ = await self.run_ai_tasks(repository)
+        return result
+    
+    async def run_ai_tasks(self, repository: str) -> Tuple[str, Tuple[Dict[str, str], ...]]:
+        """
+        Handle AI tasks like handle_ai_tasks, also returning the parsed code blocks
+        
+        Args:
+            repository: Repository in format 'owner/repo'
+            
+        Returns:
+            Task completion results as a string and the code blocks parsed from
+            the crew's result, ready to pass to save_implementations
+        """
         try:
             # Get all issues with 'ai-task' label
-            ai_tasks = await self.mcp_client.get_issues_by_label(repository, "ai-task")
+            ai_tasks = await self._issues_cache.get_issues_by_label(self.mcp_client, repository, "ai-task")
             
             if not ai_tasks:
-                return f"No AI tasks found in repository '{repository}'. Look for issues labeled as 'ai-task'."
-            
-            # Format the AI tasks data with emphasis on following exact instructions
-            tasks_data = f"Repository: {repository}\n"
-            tasks_data += f"Found {len(ai_tasks)} GitHub issues labeled as 'ai-task':\n\n"
-            tasks_data += "IMPORTANT: These are REAL GitHub issues with specific requirements. "
-            tasks_data += "You must follow the EXACT instructions provided in each issue.\n\n"
-            
-            for task in ai_tasks:
-                tasks_data += f"ISSUE #{task.number}: {task.title}\n"
-                tasks_data += f"State: {task.state}\n"
-                tasks_data += f"URL: {task.html_url}\n"
-                tasks_data += f"EXACT REQUIREMENTS:\n{task.body}\n"
-                tasks_data += "-" * 50 + "\n"
-            
-            # Create agents for AI task handling
-            task_reader_agent = Agent(
+                return f"No AI tasks found in repository '{repository}'. Look for issues labeled as 'ai-task'.", ()
+            
+            # Reuse a previous crew run over exactly the same tasks
+            cache_key = self._llm_cache.make_key(self.llm_model, repository, "ai-task", ai_tasks, crew="ai_task")
+            result = self._llm_cache.get(cache_key)
+            if result is None:
+                # kickoff() blocks for the whole LLM pipeline, so keep it off the event loop
+                result = await asyncio.to_thread(self._run_ai_task_crew, repository, ai_tasks)
+                self._llm_cache.set(cache_key, result)
+            
+            # Parse the result once for both pull request creation and the caller
+            code_blocks = tuple(self.extract_code_blocks(result))
+            
+            # Take action on the issues based on the analysis
+            action_results = await self._take_action_on_issues(repository, ai_tasks, result, code_blocks)
+            
+            return f"{result}\n\n{action_results}", code_blocks
+            
+        except Exception as e:
+            logger.error("Error handling AI tasks: %s", e)
+            return f"Error handling AI tasks: {str(e)}", ()
+    
+    def _get_task_reader_agent(self) -> Agent:
+        """Get the AI task reader agent, creating it on first use"""
+        if self._task_reader_agent is None:
+            self._task_reader_agent = Agent(
                 role="AI Task Reader",
                 goal="Read and understand the EXACT requirements from GitHub issues",
                 backstory="""You are an expert at reading and understanding GitHub issues. Your job is to extract 
@@ -166,8 +466,12 @@ class SeniorDeveloperAgent:
                 allow_delegation=False,
                 llm_model=self.llm_model
             )
-            
-            senior_dev_agent = Agent(
+        return self._task_reader_agent
+    
+    def _get_senior_dev_agent(self) -> Agent:
+        """Get the senior developer agent, creating it on first use"""
+        if self._senior_dev_agent is None:
+            self._senior_dev_agent = Agent(
                 role="Senior Developer",
                 goal="Implement solutions that EXACTLY follow the task instructions",
                 backstory="""You are a senior software developer who implements solutions that follow the EXACT 
@@ -180,8 +484,12 @@ class SeniorDeveloperAgent:
                 allow_delegation=False,
                 llm_model=self.llm_model
             )
-            
-            code_reviewer_agent = Agent(
+        return self._senior_dev_agent
+    
+    def _get_code_reviewer_agent(self) -> Agent:
+        """Get the code reviewer agent, creating it on first use"""
+        if self._code_reviewer_agent is None:
+            self._code_reviewer_agent = Agent(
                 role="Code Reviewer",
                 goal="Verify that the implementation EXACTLY matches the task requirements",
                 backstory="""You are an expert code reviewer who verifies that implementations EXACTLY match 
@@ -191,11 +499,38 @@ class SeniorDeveloperAgent:
                 allow_delegation=False,
                 llm_model=self.llm_model
             )
-            
-            # Create tasks
-            read_task = Task(
-                description=f"""Carefully analyze the following GitHub issues labeled as 'ai-task'. Your job is to extract 
-                the EXACT requirements and instructions from each issue:
+        return self._code_reviewer_agent
+    
+    def _run_ai_task_crew(self, repository: str, ai_tasks: List[GitHubIssue]) -> str:
+        """Build the AI task crew and run it on the given tasks"""
+        # Format the AI tasks data with emphasis on following exact instructions
+        parts = [
+            f"Repository: {repository}",
+            f"Found {len(ai_tasks)} GitHub issues labeled as 'ai-task':",
+            "",
+            "IMPORTANT: These are REAL GitHub issues with specific requirements. "
+            "You must follow the EXACT instructions provided in each issue.",
+            ""
+        ]
+        
+        separator = "-" * 50
+        for task in ai_tasks:
+            parts.append(f"ISSUE #{task.number}: {task.title}")
+            parts.append(f"State: {task.state}")
+            parts.append(f"URL: {task.html_url}")
+            parts.append(f"EXACT REQUIREMENTS:\n{task.body}")
+            parts.append(separator)
+        
+        tasks_data = "\n".join(parts) + "\n"
+        
+        task_reader_agent = self._get_task_reader_agent()
+        senior_dev_agent = self._get_senior_dev_agent()
+        code_reviewer_agent = self._get_code_reviewer_agent()
+        
+        # Create tasks
+        read_task = Task(
+            description=f"""Carefully analyze the following GitHub issues labeled as 'ai-task'. Your job is to extract 
+            the EXACT requirements and instructions from each issue:
 
 {tasks_data}
 
@@ -213,13 +548,13 @@ For each task, identify ONLY what is explicitly stated in the issue:
 5. The priority level if mentioned in the issue
 
 Provide a precise breakdown of what each issue specifically requests.""",
-                agent=task_reader_agent,
-                expected_output="Exact analysis of each task's requirements as stated in the GitHub issues"
-            )
-            
-            implement_task = Task(
-                description=f"""Based on the task analysis, implement solutions that EXACTLY follow the requirements 
-                stated in the GitHub issues:
+            agent=task_reader_agent,
+            expected_output="Exact analysis of each task's requirements as stated in the GitHub issues"
+        )
+        
+        implement_task = Task(
+            description=f"""Based on the task analysis, implement solutions that EXACTLY follow the requirements 
+            stated in the GitHub issues:
 
 CRITICAL REQUIREMENTS:
 - Implement ONLY what is explicitly requested in each issue
@@ -237,14 +572,14 @@ For each task, provide:
 
 IMPORTANT: Your implementation must be a direct response to what is asked for in the GitHub issue. 
 Do not add extra features, optimizations, or improvements unless they are explicitly requested.""",
-                agent=senior_dev_agent,
-                expected_output="Exact implementations that match the requirements stated in the GitHub issues",
-                context=[read_task]
-            )
-            
-            review_task = Task(
-                description=f"""Review the implemented solutions to verify they EXACTLY match the requirements 
-                stated in the GitHub issues:
+            agent=senior_dev_agent,
+            expected_output="Exact implementations that match the requirements stated in the GitHub issues",
+            context=[read_task]
+        )
+        
+        review_task = Task(
+            description=f"""Review the implemented solutions to verify they EXACTLY match the requirements 
+            stated in the GitHub issues:
 
 CRITICAL REVIEW CRITERIA:
 1. Verify that the implementation matches the EXACT requirements from the issue
@@ -261,29 +596,20 @@ For each solution, provide:
 
 IMPORTANT: Your review should focus on whether the implementation follows the exact instructions 
 from the GitHub issue, not on general code quality improvements unless specifically requested.""",
-                agent=code_reviewer_agent,
-                expected_output="Verification that implementations exactly match the GitHub issue requirements",
-                context=[implement_task]
-            )
-            
-            # Create crew
-            crew = Crew(
-                agents=[task_reader_agent, senior_dev_agent, code_reviewer_agent],
-                tasks=[read_task, implement_task, review_task],
-                verbose=True
-            )
-            
-            # Execute the crew
-            result = crew.kickoff()
-            
-            # Take action on the issues based on the analysis
-            action_results = await self._take_action_on_issues(repository, ai_tasks, result)
-            
-            return f"{result}\n\n{action_results}"
-            
-        except Exception as e:
-            logger.error(f"Error handling AI tasks: {e}")
-            return f"Error handling AI tasks: {str(e)}"
+            agent=code_reviewer_agent,
+            expected_output="Verification that implementations exactly match the GitHub issue requirements",
+            context=[implement_task]
+        )
+        
+        # Create crew
+        crew = Crew(
+            agents=[task_reader_agent, senior_dev_agent, code_reviewer_agent],
+            tasks=[read_task, implement_task, review_task],
+            verbose=True
+        )
+        
+        # Execute the crew
+        return crew.kickoff()
     
     def extract_code_blocks(self, text: str) -> List[Dict[str, str]]:
         """
@@ -295,28 +621,37 @@ from the GitHub issue, not on general code quality improvements unless specifica
         Returns:
             List of dictionaries with language and code content
         """
-        code_blocks = []
-        # Pattern to match markdown code blocks
-        pattern = r'```(\w+)?\n(.*?)```'
-        matches = re.findall(pattern, text, re.DOTALL)
-        
-        for match in matches:
-            language = match[0] if match[0] else 'text'
-            code = match[1].strip()
-            code_blocks.append({
-                'language': language,
-                'code': code
-            })
-        
-        return code_blocks
-    
-    def save_implementations(self, result: str, output_dir: str = "ai_task_implementations") -> str:
+        return [
+            {'language': match.group(1) or 'text', 'code': match.group(2).strip()}
+            for match in _CODE_BLOCK_RE.finditer(text)
+        ]
+    
+    def _implementation_files(self, code_blocks: Sequence[Dict[str, str]]) -> List[Tuple[str, str]]:
+        """
+        Map code blocks in supported languages to implementation file names
+        
+        Args:
+            code_blocks: Code blocks as returned by extract_code_blocks
+            
+        Returns:
+            (filename, code) pairs, numbered by each block's position in the analysis
+        """
+        return [
+            (f"ai_task_implementation_{i+1}{_EXT_MAP[block['language']]}", block['code'])
+            for i, block in enumerate(code_blocks)
+            if block['language'] in _SUPPORTED_LANGS
+        ]
+    
+    async def save_implementations(self, result: str, output_dir: str = "ai_task_implementations",
+                                   code_blocks: Optional[Sequence[Dict[str, str]]] = None) -> str:
         """
         Save code implementations to files
         
         Args:
             result: The result string containing code blocks
             output_dir: Directory to save implementations
+            code_blocks: Code blocks already parsed from result, e.g. by
+                run_ai_tasks; result is parsed when not given
             
         Returns:
             Summary of saved files
@@ -326,41 +661,38 @@ from the GitHub issue, not on general code quality improvements unless specifica
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
         
-        code_blocks = self.extract_code_blocks(result)
-        saved_files = []
+        files_to_save = [
+            (os.path.join(output_dir, filename), code)
+            for filename, code in self._implementation_files(
+                code_blocks if code_blocks is not None else self.extract_code_blocks(result)
+            )
+        ]
         
-        for i, block in enumerate(code_blocks):
-            if block['language'] in ['python', 'js', 'javascript', 'typescript', 'java', 'cpp', 'c', 'go', 'rust']:
-                # Determine file extension based on language
-                ext_map = {
-                    'python': '.py',
-                    'js': '.js',
-                    'javascript': '.js',
-                    'typescript': '.ts',
-                    'java': '.java',
-                    'cpp': '.cpp',
-                    'c': '.c',
-                    'go': '.go',
-                    'rust': '.rs'
-                }
-                
-                ext = ext_map.get(block['language'], '.txt')
-                filename = f"ai_task_implementation_{i+1}{ext}"
-                filepath = os.path.join(output_dir, filename)
-                
-                try:
-                    with open(filepath, 'w') as f:
-                        f.write(block['code'])
-                    saved_files.append(filepath)
-                except Exception as e:
-                    logger.error(f"Error saving file {filepath}: {e}")
+        def write_file(filepath: str, code: str):
+            with open(filepath, 'w') as f:
+                f.write(code)
+        
+        # Write the files concurrently in worker threads so disk I/O doesn't
+        # block the event loop
+        results = await asyncio.gather(
+            *(asyncio.to_thread(write_file, filepath, code) for filepath, code in files_to_save),
+            return_exceptions=True
+        )
+        
+        saved_files = []
+        for (filepath, _), error in zip(files_to_save, results):
+            if isinstance(error, Exception):
+                logger.error("Error saving file %s: %s", filepath, error)
+            else:
+                saved_files.append(filepath)
         
         if saved_files:
             return f"Saved {len(saved_files)} implementation files to {output_dir}:\n" + "\n".join(saved_files)
         else:
             return "No code files were saved (no valid code blocks found)"
     
-    async def _take_action_on_issues(self, repository: str, ai_tasks: List[GitHubIssue], analysis_result: str) -> str:
+    async def _take_action_on_issues(self, repository: str, ai_tasks: List[GitHubIssue], analysis_result: str,
+                                     code_blocks: Optional[Sequence[Dict[str, str]]] = None) -> str:
         """
         Take action on issues based on the analysis result
         
@@ -368,6 +700,8 @@ from the GitHub issue, not on general code quality improvements unless specifica
             repository: Repository in format 'owner/repo'
             ai_tasks: List of AI tasks to process
             analysis_result: Result from the Crew AI analysis
+            code_blocks: Code blocks already parsed from analysis_result;
+                analysis_result is parsed when not given
             
         Returns:
             Summary of actions taken
@@ -377,13 +711,79 @@ from the GitHub issue, not on general code quality improvements unless specifica
         action_summary.append("ACTIONS TAKEN ON ISSUES")
         action_summary.append("=" * 50)
         
-        for task in ai_tasks:
-            action_summary.append(f"\nProcessing Issue #{task.number}: {task.title}")
+        # Process issues concurrently, capping the number of issues talking
+        # to GitHub at once; results come back in the original order
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ACTIONS)
+        # The fallback comment is the same for every issue, so build it once
+        analysis_comment = f"🤖 AI Agent Analysis:\n\n{analysis_result[:500]}..."
+        # Every pull request gets the same files, so map them once
+        if code_blocks is None:
+            code_blocks = self.extract_code_blocks(analysis_result)
+        implementation_files = self._implementation_files(code_blocks)
+        try:
+            results = await asyncio.gather(
+                *(self._process_issue(repository, task, implementation_files, analysis_comment, semaphore) for task in ai_tasks),
+                return_exceptions=True
+            )
+            
+            # Comments are collected while processing and posted in one request
+            pending_comments = [
+                (task, result[1]) for task, result in zip(ai_tasks, results)
+                if not isinstance(result, Exception) and result[1] is not None
+            ]
+            # Skip the request, and the rate limiter token, when there is nothing to post
+            comment_results = []
+            if pending_comments:
+                async with self._write_limiter:
+                    comment_results = await self.mcp_client.add_issue_comments(repository, pending_comments)
+        finally:
+            # The issues were closed, commented on or linked to pull requests,
+            # so the cached list must not be handed to the next run
+            self._issues_cache.invalidate(repository, "ai-task")
+        commented = {task.number: success for (task, _), success in zip(pending_comments, comment_results)}
+        
+        for task, result in zip(ai_tasks, results):
+            if isinstance(result, Exception):
+                logger.error("Error processing issue #%s: %s", task.number, result)
+                action_summary.append(f"\nProcessing Issue #{task.number}: {task.title}")
+                action_summary.append(f"❌ Error processing issue #{task.number}: {result}")
+                continue
+            
+            lines, comment, comment_line = result
+            action_summary.extend(lines)
+            if comment is not None:
+                if commented.get(task.number):
+                    action_summary.append(comment_line)
+                else:
+                    action_summary.append(f"❌ Failed to add comment to issue #{task.number}")
+        
+        return "\n".join(action_summary)
+    
+    async def _process_issue(self, repository: str, task: GitHubIssue, implementation_files: List[Tuple[str, str]],
+                             analysis_comment: str, semaphore: asyncio.Semaphore) -> Tuple[List[str], Optional[str], Optional[str]]:
+        """
+        Take action on a single issue based on the analysis result
+        
+        Args:
+            repository: Repository in format 'owner/repo'
+            task: AI task to process
+            implementation_files: (filename, code) pairs for a pull request
+            analysis_comment: Comment posted on issues that need no other action
+            semaphore: Limits how many issues are processed concurrently
+            
+        Returns:
+            Summary lines for the actions taken on this issue, the comment to
+            post on it (or None) and the summary line to add once it is posted
+        """
+        async with semaphore:
+            action_summary = [f"\nProcessing Issue #{task.number}: {task.title}"]
+            
+            category = self._classify(task)
             
             # Check if the issue requires code changes
-            if self._requires_code_changes(task):
+            if category == "code":
                 # Create a pull request for code changes
-                pr_result = await self._create_pull_request_for_issue(repository, task, analysis_result)
+                pr_result = await self._create_pull_request_for_issue(repository, task, implementation_files)
                 action_summary.append(f"✅ {pr_result}")
                 
                 # Add a comment to the issue with the PR link
@@ -393,72 +793,71 @@ from the GitHub issue, not on general code quality improvements unless specifica
                 else:
                     comment = f"🤖 AI Agent attempted to create a pull request but encountered an issue: {pr_result}"
                 
-                await self.mcp_client.add_issue_comment(repository, task.number, comment)
-                action_summary.append(f"✅ Added comment to issue #{task.number}")
+                return action_summary, comment, f"✅ Added comment to issue #{task.number}"
                 
-            elif self._is_invalid_issue(task):
+            elif category == "invalid":
                 # Close invalid issues
                 comment = f"🤖 AI Agent: This issue appears to be invalid or unclear. Closing as requested."
-                await self.mcp_client.close_issue(repository, task.number, comment)
+                async with self._write_limiter:
+                    await self.mcp_client.close_issue(repository, task.number, comment)
                 action_summary.append(f"✅ Closed invalid issue #{task.number}")
                 
-            elif self._is_completed_issue(task):
+            elif category == "completed":
                 # Close completed issues
                 comment = f"🤖 AI Agent: This issue has been completed. Closing as requested."
-                await self.mcp_client.close_issue(repository, task.number, comment)
+                async with self._write_limiter:
+                    await self.mcp_client.close_issue(repository, task.number, comment)
                 action_summary.append(f"✅ Closed completed issue #{task.number}")
                 
             else:
                 # Add a comment with the analysis
-                comment = f"🤖 AI Agent Analysis:\n\n{analysis_result[:500]}..."
-                await self.mcp_client.add_issue_comment(repository, task.number, comment)
-                action_summary.append(f"✅ Added analysis comment to issue #{task.number}")
+                return action_summary, analysis_comment, f"✅ Added analysis comment to issue #{task.number}"
+            
+            return action_summary, None, None
+    
+    def _classify(self, task: GitHubIssue) -> str:
+        """
+        Classify an issue by the action it needs
         
-        return "\n".join(action_summary)
+        Args:
+            task: AI task to classify
+            
+        Returns:
+            'code', 'invalid', 'completed' or 'other', checked in that order
+        """
+        best = len(_CATEGORY_PRIORITY)
+        for match in _CATEGORY_RE.finditer(task.search_text):
+            best = min(best, _CATEGORY_PRIORITY.index(match.lastgroup))
+            if best == 0:
+                break
+        return _CATEGORY_PRIORITY[best] if best < len(_CATEGORY_PRIORITY) else "other"
     
     def _requires_code_changes(self, task: GitHubIssue) -> bool:
         """Check if an issue requires code changes"""
-        code_keywords = [
-            "implement", "create", "add", "fix", "update", "modify", "change",
-            "function", "class", "method", "api", "endpoint", "file", "code",
-            "script", "module", "library", "package", "component"
-        ]
-        
-        task_text = f"{task.title} {task.body}".lower()
-        return any(keyword in task_text for keyword in code_keywords)
+        return _CODE_CHANGE_RE.search(task.search_text) is not None
     
     def _is_invalid_issue(self, task: GitHubIssue) -> bool:
         """Check if an issue is invalid or unclear"""
-        invalid_keywords = [
-            "invalid", "unclear", "not clear", "confusing", "wrong", "error",
-            "duplicate", "spam", "test", "example", "sample"
-        ]
-        
-        task_text = f"{task.title} {task.body}".lower()
-        return any(keyword in task_text for keyword in invalid_keywords)
+        return _INVALID_RE.search(task.search_text) is not None
     
     def _is_completed_issue(self, task: GitHubIssue) -> bool:
         """Check if an issue is already completed"""
-        completed_keywords = [
-            "done", "completed", "finished", "resolved", "fixed", "closed",
-            "implemented", "added", "created"
-        ]
-        
-        task_text = f"{task.title} {task.body}".lower()
-        return any(keyword in task_text for keyword in completed_keywords)
+        return _COMPLETED_RE.search(task.search_text) is not None
+    
+    def _branch_name(self, task: GitHubIssue) -> str:
+        """Build the branch name for an issue from its number and a slug of its title"""
+        slug = _SLUG_RE.sub('-', task.title.lower())[:30].strip('-')
+        return f"ai-task-{task.number}-{slug}"
     
-    async def _create_pull_request_for_issue(self, repository: str, task: GitHubIssue, analysis_result: str) -> str:
-        """Create a pull request for a code change issue"""
+    async def _create_pull_request_for_issue(self, repository: str, task: GitHubIssue,
+                                             implementation_files: List[Tuple[str, str]]) -> str:
+        """Create a pull request for a code change issue from its implementation files"""
         try:
-            # Extract code blocks from the analysis
-            code_blocks = self.extract_code_blocks(analysis_result)
-            
-            if not code_blocks:
+            if not implementation_files:
                 return "No code implementation found in analysis"
             
             # Create a branch name for this issue
-            branch_name = f"ai-task-{task.number}-{task.title.lower().replace(' ', '-')[:30]}"
-            branch_name = "".join(c for c in branch_name if c.isalnum() or c == '-')
+            branch_name = self._branch_name(task)
             
             # Create pull request title and body
             pr_title = f"🤖 AI Agent: Implement {task.title}"
@@ -473,7 +872,7 @@ This pull request implements the requirements from Issue #{task.number}: {task.t
 The AI agent has analyzed the requirements and provided the following implementation:
 
 ```python
-{code_blocks[0]['code'] if code_blocks else 'Implementation details in analysis'}
+{implementation_files[0][1]}
 ```
 
 ### Files Created/Modified:
@@ -490,59 +889,46 @@ The AI agent has analyzed the requirements and provided the following implementa
             # Actually create the pull request by creating branch, files, and PR
             try:
                 # Step 1: Create the branch
-                branch_created = await self.mcp_client.create_branch(
-                    repository=repository,
-                    branch_name=branch_name,
-                    base_branch="main"
-                )
+                async with self._write_limiter:
+                    branch_created = await self.mcp_client.create_branch(
+                        repository=repository,
+                        branch_name=branch_name,
+                        base_branch="main"
+                    )
                 
                 if not branch_created:
                     return f"❌ Failed to create branch {branch_name} for issue #{task.number}"
                 
-                # Step 2: Create implementation files in the branch
+                # Step 2: Create implementation files in the branch. Each file is
+                # a commit on the same ref and GitHub rejects concurrent commits
+                # to one branch, so they are created one after another
                 files_created = 0
-                for i, block in enumerate(code_blocks):
-                    if block['language'] in ['python', 'js', 'javascript', 'typescript', 'java', 'cpp', 'c', 'go', 'rust']:
-                        # Determine file extension and path
-                        ext_map = {
-                            'python': '.py',
-                            'js': '.js',
-                            'javascript': '.js',
-                            'typescript': '.ts',
-                            'java': '.java',
-                            'cpp': '.cpp',
-                            'c': '.c',
-                            'go': '.go',
-                            'rust': '.rs'
-                        }
-                        
-                        ext = ext_map.get(block['language'], '.txt')
-                        filename = f"ai_task_implementation_{i+1}{ext}"
-                        file_path = f"ai_task_implementations/{filename}"
-                        
-                        # Create the file in the repository
+                for filename, code in implementation_files:
+                    # Create the file in the repository
+                    async with self._write_limiter:
                         file_created = await self.mcp_client.create_file(
                             repository=repository,
-                            path=file_path,
-                            content=block['code'],
+                            path=f"ai_task_implementations/{filename}",
+                            content=code,
                             branch=branch_name,
                             message=f"Add implementation for issue #{task.number}"
                         )
-                        
-                        if file_created:
-                            files_created += 1
+                    
+                    if file_created:
+                        files_created += 1
                 
                 if files_created == 0:
                     return f"❌ No implementation files were created for issue #{task.number}"
                 
                 # Step 3: Create the pull request
-                pr_result = await self.mcp_client.create_pull_request(
-                    repository=repository,
-                    title=pr_title,
-                    body=pr_body,
-                    head=branch_name,
-                    base="main"
-                )
+                async with self._write_limiter:
+                    pr_result = await self.mcp_client.create_pull_request(
+                        repository=repository,
+                        title=pr_title,
+                        body=pr_body,
+                        head=branch_name,
+                        base="main"
+                    )
                 
                 if pr_result:
                     pr_number = pr_result.get('number', 'unknown')
@@ -552,9 +938,9 @@ The AI agent has analyzed the requirements and provided the following implementa
                     return f"❌ Failed to create pull request for issue #{task.number}"
                 
             except Exception as pr_error:
-                logger.error(f"Error creating pull request: {pr_error}")
+                logger.error("Error creating pull request: %s", pr_error)
                 return f"❌ Error creating pull request: {str(pr_error)}"
             
         except Exception as e:
-            logger.error(f"Error creating pull request for issue #{task.number}: {e}")
+            logger.error("Error creating pull request for issue #%s: %s", task.number, e)
             return f"Error creating pull request: {str(e)}" 
\ No newline at end of file
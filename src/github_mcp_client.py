@@ -1,141 +1,512 @@
 import asyncio
+import functools
 import json
 import logging
-from typing import List, Dict, Any, Optional
+import random
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple, Type
 import aiohttp
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, field_validator
 
 logger = logging.getLogger(__name__)
 
+# orjson serialises request payloads straight to bytes and parses response
+# bytes without decoding them to str first; fall back to the standard
+# library where it isn't installed
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+    
+    _loads = json.loads
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Payloads with more content than this are encoded in a worker thread so
+# the event loop keeps serving other calls meanwhile
+_LARGE_CONTENT_THRESHOLD = 64_000
+
+# Bytes of an error response body read for logging
+_ERROR_BODY_LIMIT = 2048
+
+# Gateway errors worth retrying for reads; the MCP server may be restarting
+_RETRYABLE_STATUSES = frozenset({502, 503, 504})
+
+class Label(BaseModel):
+    """Model for the parts of a GitHub label we use"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
+    name: str
+    color: str = ""
+
 class GitHubIssue(BaseModel):
     """Model for GitHub issue data"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     number: int
     title: str
     body: str
     state: str
-    labels: List[Dict[str, Any]]
+    labels: Tuple[Label, ...] = ()
     created_at: str
     updated_at: str
     html_url: str
+    node_id: Optional[str] = None
+    
+    @field_validator("body", mode="before")
+    @classmethod
+    def _null_body(cls, value: Any) -> Any:
+        # GitHub sends a null body for issues without a description
+        return "" if value is None else value
+    
+    # Plain properties rather than cached_property: pydantic compares, hashes
+    # and copies models through __dict__, where cached values would leak
+    @property
+    def label_names(self) -> str:
+        """Comma-separated label names"""
+        return ", ".join(label.name for label in self.labels)
+    
+    @property
+    def search_text(self) -> str:
+        """Title and body joined for keyword matching"""
+        return f"{self.title} {self.body}"
+
+class _IssueResult(BaseModel):
+    """Result of a github.get_issue call"""
+    issue: Optional[GitHubIssue] = None
+    etag: Optional[str] = None
+    not_modified: bool = False
+
+class _IssueResponse(BaseModel):
+    """MCP response envelope for github.get_issue, parsed straight from JSON"""
+    result: Optional[_IssueResult] = None
+
+class _IssueListResult(BaseModel):
+    """Result of a github.list_issues call"""
+    issues: List[GitHubIssue] = []
+    etag: Optional[str] = None
+    not_modified: bool = False
+
+class _IssueListResponse(BaseModel):
+    """MCP response envelope for github.list_issues, parsed straight from JSON"""
+    result: Optional[_IssueListResult] = None
+
+@functools.lru_cache(maxsize=128)
+def _split_repo(repository: str) -> Tuple[str, str]:
+    """Split 'owner/repo' into its owner and repository name"""
+    owner, sep, repo = repository.partition('/')
+    if not sep:
+        raise ValueError(f"Repository must be in format 'owner/repo', got {repository!r}")
+    return owner, repo
+
+@functools.lru_cache(maxsize=128)
+def _payload_prefix(method: str, repository: str) -> bytes:
+    """
+    Serialise the fixed start of an MCP payload for a method and repository
+    
+    The closing braces are left off so that each call only has to encode
+    its own params and append them.
+    """
+    owner, repo = _split_repo(repository)
+    return _dumps({"method": method, "params": {"owner": owner, "repo": repo}})[:-2]
+
+def _encode_payload(method: str, repository: str, params: Dict[str, Any]) -> bytes:
+    """Encode an MCP payload, reusing the cached prefix for its method and repository"""
+    prefix = _payload_prefix(method, repository)
+    if not params:
+        return prefix + b"}}"
+    # Splice the params object's members in after owner and repo
+    return prefix + b"," + _dumps(params)[1:] + b"}"
+
+_ISSUE_FIELDS = frozenset(GitHubIssue.model_fields)
+_REQUIRED_ISSUE_FIELDS = frozenset(
+    name for name, field in GitHubIssue.model_fields.items() if field.is_required()
+)
+
+def _parse_issue(issue_data: Dict[str, Any], validate: bool = False) -> GitHubIssue:
+    """
+    Build a GitHubIssue from issue data returned by the MCP server
+    
+    The server is trusted, so by default the model is constructed without
+    running pydantic validation; pass validate=True for the full checks.
+    """
+    if validate:
+        # Uses the core schema pydantic compiled once when the model was defined
+        return GitHubIssue.model_validate(issue_data)
+    
+    missing = _REQUIRED_ISSUE_FIELDS.difference(issue_data)
+    if missing:
+        raise ValueError(f"missing fields {', '.join(sorted(missing))}")
+    
+    payload = {name: issue_data[name] for name in _ISSUE_FIELDS if name in issue_data}
+    # Mirrors GitHubIssue._null_body, which model_construct does not run
+    if payload["body"] is None:
+        payload["body"] = ""
+    payload["labels"] = tuple(
+        Label.model_construct(name=label.get("name", ""), color=label.get("color", ""))
+        for label in payload.get("labels", ())
+    )
+    return GitHubIssue.model_construct(**payload)
+
+def _parse_issues(issues_data: Optional[List[Dict[str, Any]]], validate: bool = False) -> List[GitHubIssue]:
+    """Parse a list of issues, skipping any that cannot be parsed"""
+    if not issues_data:
+        return []
+    
+    # Parse everything in one comprehension; only fall back to the slower
+    # per-issue loop when something fails to parse
+    try:
+        return [_parse_issue(issue_data, validate) for issue_data in issues_data]
+    except Exception:
+        pass
+    
+    issues = []
+    for issue_data in issues_data:
+        try:
+            issues.append(_parse_issue(issue_data, validate))
+        except Exception as e:
+            logger.warning("Failed to parse issue %s: %s", issue_data.get('number', 'unknown'), e)
+    return issues
+
+def _log_outcome(result: Optional[Dict[str, Any]], action: str, *args: Any) -> bool:
+    """
+    Log whether a call reporting 'success' worked and return the flag
+    
+    action is a %-style description of the call, formatted with args only
+    if the message is emitted.
+    """
+    success = bool(result and result.get("success"))
+    # A None result means the call itself failed, which _call already logged
+    if success:
+        logger.info("Successfully completed: " + action, *args)
+    elif result is not None:
+        logger.error("Failed to " + action, *args)
+    return success
 
 class GitHubMCPClient:
-    """Client for interacting with GitHub MCP server"""
+    """
+    Client for interacting with GitHub MCP server
+    
+    All calls share one pooled session, so keep a single client for the
+    lifetime of the agents using it rather than creating one per call.
+    """
+    
+    # Maximum number of read results kept for ETag revalidation
+    ETAG_CACHE_SIZE = 128
+    # Maximum number of issues kept for get_issue_details, in a separate LRU so
+    # seeding a large listing cannot evict the list ETags
+    ISSUE_DETAILS_CACHE_SIZE = 1024
+    # Seconds an issue from get_issue_details is reused without asking the server
+    ISSUE_DETAILS_TTL = 60
+    # Maximum number of batched requests in flight at once
+    MAX_CONCURRENT_REQUESTS = 10
+    # Attempts made for idempotent reads before giving up
+    MAX_READ_ATTEMPTS = 3
     
     def __init__(self, server_url: str = "http://localhost:3000"):
         self.server_url = server_url
         self.session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+        self._batch_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        # (method, params) -> (etag, parsed result, time stored), least recently used first
+        self._etag_cache: "OrderedDict[Tuple, Tuple[Optional[str], Any, float]]" = OrderedDict()
+        # ("github.get_issue", repository, number) -> same entries, for issue details
+        self._details_cache: "OrderedDict[Tuple, Tuple[Optional[str], Any, float]]" = OrderedDict()
+        self._warm_task: Optional[asyncio.Task] = None
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        await self._get_session()
+        # Resolve DNS and open a pooled connection while the caller gets ready
+        self._warm_task = asyncio.create_task(self._warm())
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._warm_task and not self._warm_task.done():
+            self._warm_task.cancel()
         if self.session:
             await self.session.close()
     
-    async def get_issues_by_label(self, repository: str, label: str) -> List[GitHubIssue]:
+    async def _warm(self):
+        """Probe the server so the first real call reuses a live connection"""
+        try:
+            session = await self._get_session()
+            async with session.head(f"{self.server_url}/health"):
+                pass
+        except Exception as e:
+            # Only an optimisation; the first call connects as usual
+            logger.debug("Connection warm-up failed: %s", e)
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared session, creating it on first use"""
+        if self.session is None or self.session.closed:
+            async with self._session_lock:
+                if self.session is None or self.session.closed:
+                    # Keep connections to the MCP server alive between calls.
+                    # Idle connections are dropped before the server's 75s
+                    # keep-alive expires, so a call never picks up a socket the
+                    # server is closing
+                    connector = aiohttp.TCPConnector(
+                        limit=100,
+                        limit_per_host=20,
+                        keepalive_timeout=60,
+                        ttl_dns_cache=300
+                    )
+                    # Bound connecting and each read rather than the whole
+                    # call, so large file uploads aren't cut off part way
+                    self.session = aiohttp.ClientSession(
+                        connector=connector,
+                        timeout=aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=60)
+                    )
+        return self.session
+    
+    def _cache_for(self, key: Tuple) -> Tuple["OrderedDict", int]:
+        """Get the LRU and its size limit that hold the result for a read key"""
+        if key[0] == "github.get_issue":
+            return self._details_cache, self.ISSUE_DETAILS_CACHE_SIZE
+        return self._etag_cache, self.ETAG_CACHE_SIZE
+    
+    def _cached_response(self, key: Tuple) -> Tuple[Optional[str], Any, float]:
+        """Get the (etag, result, time stored) kept for a read, or (None, None, 0.0)"""
+        cache, _ = self._cache_for(key)
+        entry = cache.get(key)
+        if entry is None:
+            return None, None, 0.0
+        cache.move_to_end(key)
+        return entry
+    
+    def _store_response(self, key: Tuple, etag: Optional[str], value: Any):
+        """
+        Remember a read result and its ETag, evicting the least recently used
+        
+        Results without an ETag are kept too: they can't be revalidated, but
+        reads with a TTL still reuse them until it runs out.
+        """
+        cache, size = self._cache_for(key)
+        cache[key] = (etag, value, time.monotonic())
+        cache.move_to_end(key)
+        if len(cache) > size:
+            cache.popitem(last=False)
+    
+    def _seed_issue_details(self, repository: str, issues: List[GitHubIssue]):
+        """Cache listed issues as their details, since the list carries the full issue"""
+        now = time.monotonic()
+        for issue in issues:
+            key = ("github.get_issue", repository, issue.number)
+            # Keep a known ETag: a 304 against it still resolves to this issue
+            etag, _, _ = self._details_cache.get(key, (None, None, 0.0))
+            self._details_cache[key] = (etag, issue, now)
+            self._details_cache.move_to_end(key)
+        while len(self._details_cache) > self.ISSUE_DETAILS_CACHE_SIZE:
+            self._details_cache.popitem(last=False)
+    
+    def invalidate(self, repository: str, issue_number: int):
+        """Forget the cached details of an issue so the next read fetches it again"""
+        self._details_cache.pop(("github.get_issue", repository, issue_number), None)
+    
+    async def get_issues_by_label(self, repository: str, label: str, validate: bool = False) -> List[GitHubIssue]:
         """
         Get issues from a repository filtered by a specific label
         
         Args:
             repository: Repository in format 'owner/repo'
             label: Label to filter by
+            validate: Run full pydantic validation on each issue
             
         Returns:
             List of GitHubIssue objects
         """
-        try:
-            if not self.session:
-                self.session = aiohttp.ClientSession()
+        key = ("github.list_issues", repository, label)
+        etag, cached, _ = self._cached_response(key)
+        
+        issues, new_etag = await self.get_issues_by_label_conditional(repository, label, etag, validate)
+        if issues is None:
+            # Unchanged since the cached result was fetched
+            return cached if cached is not None else []
+        
+        self._seed_issue_details(repository, issues)
+        self._store_response(key, new_etag, issues)
+        return issues
+    
+    async def get_issues_by_label_conditional(self, repository: str, label: str,
+                                              etag: Optional[str] = None,
+                                              validate: bool = False) -> Tuple[Optional[List[GitHubIssue]], Optional[str]]:
+        """
+        Get issues filtered by a label, revalidating a previous result with its ETag
+        
+        Args:
+            repository: Repository in format 'owner/repo'
+            label: Label to filter by
+            etag: ETag returned with the previously fetched issues, if any
+            validate: Run full pydantic validation on each issue
             
-            # MCP call to get issues with specific label
-            payload = {
-                "method": "github.list_issues",
-                "params": {
-                    "owner": repository.split('/')[0],
-                    "repo": repository.split('/')[1],
-                    "labels": [label],
-                    "state": "all"  # Get both open and closed issues
-                }
-            }
+        Returns:
+            (issues, etag) where issues is None if they are unchanged since etag
+        """
+        params = {
+            "labels": [label],
+            "state": "all"  # Get both open and closed issues
+        }
+        if etag:
+            params["etag"] = etag
+        
+        listed = await self._list_issues(repository, params, validate)
+        if listed is None:
+            return [], None
+        
+        issues, new_etag = listed
+        if issues is None:
+            return None, etag
+        
+        return issues, new_etag
+    
+    async def iter_issues_by_label(self, repository: str, label: str, state: str = "all",
+                                   per_page: int = 100) -> AsyncIterator[GitHubIssue]:
+        """
+        Iterate over every issue with a label, fetching one page at a time
+        
+        Unlike get_issues_by_label this follows pagination, and only the
+        current page is held in memory, so callers can stop early.
+        
+        Args:
+            repository: Repository in format 'owner/repo'
+            label: Label to filter by
+            state: Issue state to filter by ('open', 'closed' or 'all')
+            per_page: Issues requested per page (GitHub allows up to 100)
+            
+        Yields:
+            GitHubIssue objects in the order GitHub returns them
+        """
+        page = 1
+        while True:
+            result = await self._call("github.list_issues", repository, {
+                "labels": [label],
+                "state": state,
+                "page": page,
+                "per_page": per_page
+            }, idempotent=True)
+            if result is None:
+                return
+            
+            issues_data = result.get("issues", [])
+            for issue in _parse_issues(issues_data, False):
+                yield issue
+            
+            # A short page is the last one
+            if len(issues_data) < per_page:
+                return
+            page += 1
+    
+    async def stream_issues_by_label(self, repository: str, label: str,
+                                     state: str = "all") -> AsyncIterator[GitHubIssue]:
+        """
+        Iterate over every issue with a label, streamed from the server in one call
+        
+        The server follows GitHub's pagination itself and sends issues as
+        newline-delimited JSON while it fetches later pages, so issues are
+        yielded as soon as they arrive.
+        
+        Args:
+            repository: Repository in format 'owner/repo'
+            label: Label to filter by
+            state: Issue state to filter by ('open', 'closed' or 'all')
             
-            async with self.session.post(
-                f"{self.server_url}/call",
-                json=payload,
-                headers={"Content-Type": "application/json"}
+        Yields:
+            GitHubIssue objects in the order GitHub returns them
+        """
+        method = "github.list_issues"
+        body = _encode_payload(method, repository, {"labels": [label], "state": state})
+        
+        try:
+            session = await self._get_session()
+            async with session.post(
+                f"{self.server_url}/call/stream",
+                data=body,
+                headers=_JSON_HEADERS
             ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    issues = []
-                    
-                    if "result" in data and "issues" in data["result"]:
-                        for issue_data in data["result"]["issues"]:
-                            try:
-                                issue = GitHubIssue(**issue_data)
-                                issues.append(issue)
-                            except Exception as e:
-                                logger.warning(f"Failed to parse issue {issue_data.get('number', 'unknown')}: {e}")
-                    
-                    return issues
-                else:
-                    error_text = await response.text()
-                    logger.error(f"Failed to get issues: {response.status} - {error_text}")
-                    return []
-                    
+                if response.status != 200:
+                    await self._read_result(method, response, None)
+                    return
+                
+                # Split on newlines ourselves: an issue with a long body can
+                # exceed the line length aiohttp's readline allows
+                buffer = b""
+                async for chunk in response.content.iter_any():
+                    *lines, buffer = (buffer + chunk).split(b"\n")
+                    for issue in _parse_issues([_loads(line) for line in lines if line]):
+                        yield issue
+                
+                # The last record may end without a trailing newline
+                if buffer.strip():
+                    for issue in _parse_issues([_loads(buffer)]):
+                        yield issue
         except Exception as e:
-            logger.error(f"Error getting issues by label: {e}")
-            return []
+            logger.error("Error streaming %s: %s", method, e)
     
-    async def get_all_open_issues(self, repository: str) -> List[GitHubIssue]:
+    async def get_all_open_issues(self, repository: str, validate: bool = False) -> List[GitHubIssue]:
         """
         Get all open issues from a repository (regardless of labels)
         
         Args:
             repository: Repository in format 'owner/repo'
+            validate: Run full pydantic validation on each issue
             
         Returns:
             List of GitHubIssue objects
         """
-        try:
-            if not self.session:
-                self.session = aiohttp.ClientSession()
-            
-            # MCP call to get all open issues
-            payload = {
-                "method": "github.list_issues",
-                "params": {
-                    "owner": repository.split('/')[0],
-                    "repo": repository.split('/')[1],
-                    "state": "open"  # Get only open issues
-                }
-            }
-            
-            async with self.session.post(
-                f"{self.server_url}/call",
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    issues = []
-                    
-                    if "result" in data and "issues" in data["result"]:
-                        for issue_data in data["result"]["issues"]:
-                            try:
-                                issue = GitHubIssue(**issue_data)
-                                issues.append(issue)
-                            except Exception as e:
-                                logger.warning(f"Failed to parse issue {issue_data.get('number', 'unknown')}: {e}")
-                    
-                    return issues
-                else:
-                    error_text = await response.text()
-                    logger.error(f"Failed to get all open issues: {response.status} - {error_text}")
-                    return []
-                    
-        except Exception as e:
-            logger.error(f"Error getting all open issues: {e}")
+        key = ("github.list_issues", repository, None)
+        etag, cached, _ = self._cached_response(key)
+        
+        params = {"state": "open"}  # Get only open issues
+        if etag:
+            params["etag"] = etag
+        
+        listed = await self._list_issues(repository, params, validate)
+        if listed is None:
             return []
+        
+        issues, new_etag = listed
+        if issues is None:
+            # Unchanged since the cached result was fetched
+            return cached if cached is not None else []
+        
+        # Listed issues already carry body and labels, so later detail reads
+        # within ISSUE_DETAILS_TTL are served without a per-issue round trip
+        self._seed_issue_details(repository, issues)
+        self._store_response(key, new_etag, issues)
+        return issues
+    
+    async def _list_issues(self, repository: str, params: Dict[str, Any],
+                           validate: bool) -> Optional[Tuple[Optional[List[GitHubIssue]], Optional[str]]]:
+        """
+        Call github.list_issues and parse the issues it returns
+        
+        With validate the response bytes are decoded and validated into
+        models in a single pydantic-core pass, and one invalid issue fails
+        the whole list. Otherwise issues are built without validation and
+        any that cannot be parsed are skipped.
+        
+        Returns:
+            (issues, etag) where issues is None if they are not modified,
+            or None if the call failed
+        """
+        if validate:
+            response = await self._call("github.list_issues", repository, params,
+                                        response_model=_IssueListResponse, idempotent=True)
+            if response is None or response.result is None:
+                return None
+            result = response.result
+            return (None if result.not_modified else result.issues), result.etag
+        
+        result = await self._call("github.list_issues", repository, params, idempotent=True)
+        if result is None:
+            return None
+        if result.get("not_modified"):
+            return None, result.get("etag")
+        return _parse_issues(result.get("issues")), result.get("etag")
     
     async def get_issue_details(self, repository: str, issue_number: int) -> Optional[GitHubIssue]:
         """
@@ -148,40 +519,53 @@ class GitHubMCPClient:
         Returns:
             GitHubIssue object or None if not found
         """
-        try:
-            if not self.session:
-                self.session = aiohttp.ClientSession()
-            
-            payload = {
-                "method": "github.get_issue",
-                "params": {
-                    "owner": repository.split('/')[0],
-                    "repo": repository.split('/')[1],
-                    "issue_number": issue_number
-                }
-            }
-            
-            async with self.session.post(
-                f"{self.server_url}/call",
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    if "result" in data and "issue" in data["result"]:
-                        return GitHubIssue(**data["result"]["issue"])
-                    else:
-                        logger.warning(f"No issue data found for #{issue_number}")
-                        return None
-                else:
-                    error_text = await response.text()
-                    logger.error(f"Failed to get issue #{issue_number}: {response.status} - {error_text}")
-                    return None
-                    
-        except Exception as e:
-            logger.error(f"Error getting issue details: {e}")
+        key = ("github.get_issue", repository, issue_number)
+        etag, cached, stored_at = self._cached_response(key)
+        
+        # Recently fetched issues are reused without a round trip
+        if cached is not None and time.monotonic() - stored_at < self.ISSUE_DETAILS_TTL:
+            return cached
+        
+        params = {"issue_number": issue_number}
+        if etag:
+            params["etag"] = etag
+        
+        response = await self._call("github.get_issue", repository, params,
+                                   response_model=_IssueResponse, idempotent=True)
+        if response is None:
+            return None
+        
+        result = response.result
+        if result is not None and result.not_modified and cached is not None:
+            self._store_response(key, etag, cached)
+            return cached
+        
+        if result is None or result.issue is None:
+            logger.warning("No issue data found for #%s", issue_number)
             return None
+        
+        self._store_response(key, result.etag, result.issue)
+        return result.issue
+    
+    async def get_issue_details_batch(self, repository: str, issue_numbers: List[int]) -> List[Optional[GitHubIssue]]:
+        """
+        Get details for several issues concurrently
+        
+        Args:
+            repository: Repository in format 'owner/repo'
+            issue_numbers: Issue numbers to retrieve
+            
+        Returns:
+            GitHubIssue objects in the order requested, None for issues that
+            could not be retrieved
+        """
+        async def get_one(issue_number: int) -> Optional[GitHubIssue]:
+            async with self._batch_semaphore:
+                return await self.get_issue_details(repository, issue_number)
+        
+        # get_issue_details logs and returns None on failure, so one missing
+        # issue does not abort the rest of the batch
+        return await asyncio.gather(*(get_one(issue_number) for issue_number in issue_numbers))
     
     async def close_issue(self, repository: str, issue_number: int, comment: str = None) -> bool:
         """
@@ -195,41 +579,12 @@ class GitHubMCPClient:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            if not self.session:
-                self.session = aiohttp.ClientSession()
-            
-            payload = {
-                "method": "github.close_issue",
-                "params": {
-                    "owner": repository.split('/')[0],
-                    "repo": repository.split('/')[1],
-                    "issue_number": issue_number,
-                    "comment": comment
-                }
-            }
-            
-            async with self.session.post(
-                f"{self.server_url}/call",
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    success = data.get("result", {}).get("success", False)
-                    if success:
-                        logger.info(f"Successfully closed issue #{issue_number}")
-                    else:
-                        logger.error(f"Failed to close issue #{issue_number}")
-                    return success
-                else:
-                    error_text = await response.text()
-                    logger.error(f"Failed to close issue #{issue_number}: {response.status} - {error_text}")
-                    return False
-                    
-        except Exception as e:
-            logger.error(f"Error closing issue: {e}")
-            return False
+        result = await self._call("github.close_issue", repository, {
+            "issue_number": issue_number,
+            "comment": comment
+        })
+        self.invalidate(repository, issue_number)
+        return _log_outcome(result, "close issue #%s", issue_number)
     
     async def add_issue_comment(self, repository: str, issue_number: int, comment: str) -> bool:
         """
@@ -243,41 +598,38 @@ class GitHubMCPClient:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            if not self.session:
-                self.session = aiohttp.ClientSession()
-            
-            payload = {
-                "method": "github.add_issue_comment",
-                "params": {
-                    "owner": repository.split('/')[0],
-                    "repo": repository.split('/')[1],
-                    "issue_number": issue_number,
-                    "comment": comment
-                }
-            }
+        result = await self._call("github.add_issue_comment", repository, {
+            "issue_number": issue_number,
+            "comment": comment
+        })
+        self.invalidate(repository, issue_number)
+        return _log_outcome(result, "add comment to issue #%s", issue_number)
+    
+    async def add_issue_comments(self, repository: str, comments: List[Tuple[GitHubIssue, str]]) -> List[bool]:
+        """
+        Add comments to several issues in a single request
+        
+        Args:
+            repository: Repository in format 'owner/repo'
+            comments: (issue, comment text) pairs
             
-            async with self.session.post(
-                f"{self.server_url}/call",
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    success = data.get("result", {}).get("success", False)
-                    if success:
-                        logger.info(f"Successfully added comment to issue #{issue_number}")
-                    else:
-                        logger.error(f"Failed to add comment to issue #{issue_number}")
-                    return success
-                else:
-                    error_text = await response.text()
-                    logger.error(f"Failed to add comment to issue #{issue_number}: {response.status} - {error_text}")
-                    return False
-                    
-        except Exception as e:
-            logger.error(f"Error adding comment: {e}")
-            return False
+        Returns:
+            Success flag for each comment, in order
+        """
+        if not comments:
+            return []
+        
+        result = await self._call("github.add_issue_comments", repository, {
+            "comments": [
+                {"issue_number": issue.number, "node_id": issue.node_id, "comment": comment}
+                for issue, comment in comments
+            ]
+        })
+        for issue, _ in comments:
+            self.invalidate(repository, issue.number)
+        results = (result or {}).get("results") or [False] * len(comments)
+        logger.info("Added %s of %s comments", sum(results), len(comments))
+        return results
     
     async def create_pull_request(self, repository: str, title: str, body: str, 
                                  head: str, base: str = "main") -> Optional[Dict[str, Any]]:
@@ -294,43 +646,21 @@ class GitHubMCPClient:
         Returns:
             Pull request data or None if failed
         """
-        try:
-            if not self.session:
-                self.session = aiohttp.ClientSession()
-            
-            payload = {
-                "method": "github.create_pull_request",
-                "params": {
-                    "owner": repository.split('/')[0],
-                    "repo": repository.split('/')[1],
-                    "title": title,
-                    "body": body,
-                    "head": head,
-                    "base": base
-                }
-            }
-            
-            async with self.session.post(
-                f"{self.server_url}/call",
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    pr_data = data.get("result", {}).get("pull_request")
-                    if pr_data:
-                        logger.info(f"Successfully created pull request #{pr_data.get('number', 'unknown')}")
-                    else:
-                        logger.error("Failed to create pull request")
-                    return pr_data
-                else:
-                    error_text = await response.text()
-                    logger.error(f"Failed to create pull request: {response.status} - {error_text}")
-                    return None
-                    
-        except Exception as e:
-            logger.error(f"Error creating pull request: {e}")
+        result = await self._call("github.create_pull_request", repository, {
+            "title": title,
+            "body": body,
+            "head": head,
+            "base": base
+        })
+        if result is None:
             return None
+        
+        pr_data = result.get("pull_request")
+        if pr_data:
+            logger.info("Successfully created pull request #%s", pr_data.get('number', 'unknown'))
+        else:
+            logger.error("Failed to create pull request")
+        return pr_data
     
     async def create_branch(self, repository: str, branch_name: str, base_branch: str = "main") -> bool:
         """
@@ -344,41 +674,11 @@ class GitHubMCPClient:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            if not self.session:
-                self.session = aiohttp.ClientSession()
-            
-            payload = {
-                "method": "github.create_branch",
-                "params": {
-                    "owner": repository.split('/')[0],
-                    "repo": repository.split('/')[1],
-                    "branch_name": branch_name,
-                    "base_branch": base_branch
-                }
-            }
-            
-            async with self.session.post(
-                f"{self.server_url}/call",
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    success = data.get("result", {}).get("success", False)
-                    if success:
-                        logger.info(f"Successfully created branch {branch_name}")
-                    else:
-                        logger.error(f"Failed to create branch {branch_name}")
-                    return success
-                else:
-                    error_text = await response.text()
-                    logger.error(f"Failed to create branch {branch_name}: {response.status} - {error_text}")
-                    return False
-                    
-        except Exception as e:
-            logger.error(f"Error creating branch: {e}")
-            return False
+        result = await self._call("github.create_branch", repository, {
+            "branch_name": branch_name,
+            "base_branch": base_branch
+        })
+        return _log_outcome(result, "create branch %s", branch_name)
     
     async def create_file(self, repository: str, path: str, content: str, 
                          branch: str, message: str) -> bool:
@@ -395,40 +695,82 @@ class GitHubMCPClient:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            if not self.session:
-                self.session = aiohttp.ClientSession()
+        result = await self._call("github.create_file", repository, {
+            "path": path,
+            "content": content,
+            "branch": branch,
+            "message": message
+        }, encode_in_thread=len(content) > _LARGE_CONTENT_THRESHOLD)
+        return _log_outcome(result, "create file %s", path)
+    
+    async def _call(self, method: str, repository: str, params: Dict[str, Any],
+                    response_model: Optional[Type[BaseModel]] = None, idempotent: bool = False,
+                    encode_in_thread: bool = False) -> Any:
+        """
+        Call a method on the MCP server
+        
+        Args:
+            method: MCP method name, e.g. 'github.close_issue'
+            repository: Repository in format 'owner/repo'
+            params: Method parameters besides the owner and repo
+            response_model: Model to validate the raw response body against
+            idempotent: Retry gateway and connection errors; only safe for reads
+            encode_in_thread: Encode the payload in a worker thread; for large payloads
             
-            payload = {
-                "method": "github.create_file",
-                "params": {
-                    "owner": repository.split('/')[0],
-                    "repo": repository.split('/')[1],
-                    "path": path,
-                    "content": content,
-                    "branch": branch,
-                    "message": message
-                }
-            }
+        Returns:
+            The method's result dict, or the validated response_model if one
+            is given; None if the call failed
+        """
+        attempts = self.MAX_READ_ATTEMPTS if idempotent else 1
+        
+        try:
+            session = await self._get_session()
+            if encode_in_thread:
+                body = await asyncio.to_thread(_encode_payload, method, repository, params)
+            else:
+                body = _encode_payload(method, repository, params)
             
-            async with self.session.post(
-                f"{self.server_url}/call",
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    success = data.get("result", {}).get("success", False)
-                    if success:
-                        logger.info(f"Successfully created file {path}")
-                    else:
-                        logger.error(f"Failed to create file {path}")
-                    return success
-                else:
-                    error_text = await response.text()
-                    logger.error(f"Failed to create file {path}: {response.status} - {error_text}")
-                    return False
-                    
+            for attempt in range(attempts):
+                last_attempt = attempt == attempts - 1
+                try:
+                    async with session.post(
+                        f"{self.server_url}/call",
+                        data=body,
+                        headers=_JSON_HEADERS
+                    ) as response:
+                        if response.status not in _RETRYABLE_STATUSES or last_attempt:
+                            return await self._read_result(method, response, response_model)
+                        logger.warning("%s returned %s, retrying", method, response.status)
+                except aiohttp.ClientConnectionError as e:
+                    if last_attempt:
+                        raise
+                    logger.warning("%s connection error, retrying: %s", method, e)
+                
+                # Exponential backoff with jitter so retries don't arrive in lockstep
+                await asyncio.sleep(0.1 * 2 ** attempt + random.uniform(0, 0.05))
+                
         except Exception as e:
-            logger.error(f"Error creating file: {e}")
-            return False 
\ No newline at end of file
+            logger.error("Error calling %s: %s", method, e)
+            return None
+    
+    @staticmethod
+    async def _read_result(method: str, response: aiohttp.ClientResponse,
+                           response_model: Optional[Type[BaseModel]]) -> Any:
+        """Read the result of an MCP call from the server's response"""
+        if response.status != 200:
+            # Only read the error body if it is going to be logged, and then
+            # just its start; the rest is dropped when the response is released
+            if logger.isEnabledFor(logging.ERROR):
+                error_text = (await response.content.read(_ERROR_BODY_LIMIT)).decode("utf-8", "replace")
+                logger.error("%s failed: %s - %s", method, response.status, error_text)
+            return None
+        
+        if response_model is not None:
+            # Validate the raw bytes directly instead of building a dict first
+            return response_model.model_validate_json(await response.read())
+        
+        data = _loads(await response.read())
+        if data.get("error"):
+            logger.error("%s failed: %s", method, data['error'])
+            return None
+        return data.get("result") or {}
@@ -1,113 +1,466 @@
 import asyncio
+import contextlib
+import functools
 import json
 import logging
 import os
-from typing import Dict, Any, List, Optional
-from aiohttp import web, ClientSession
-from pydantic import BaseModel
+import random
+import signal
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Awaitable, Callable, Dict, Any, List, Optional, Tuple, TypedDict
+from aiohttp import web, ClientConnectionError, ClientResponse, ClientSession, ClientTimeout, TCPConnector
 
 logger = logging.getLogger(__name__)
 
-class MCPRequest(BaseModel):
+# orjson serialises straight to bytes and parses request and GitHub response
+# bytes without decoding them to str first; fall back to the standard library
+# where it isn't installed
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+    
+    def _dumps_str(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+    
+    _loads = json.loads
+    _dumps_str = json.dumps
+
+# Request bodies that never change, encoded once
+_CLOSE_ISSUE_BODY = _dumps({"state": "closed"})
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Statuses worth retrying: rate limiting and gateway errors
+_RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+# Methods that can be resent after an error without applying twice
+_IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "PATCH"})
+
+# Only the start of an error body is logged; the rest is left unread
+_ERROR_BODY_LIMIT = 2048
+
+async def _log_api_error(response, message: str = "GitHub API error"):
+    """Log a failed GitHub response, reading at most _ERROR_BODY_LIMIT bytes of its body"""
+    if not logger.isEnabledFor(logging.ERROR):
+        return
+    error_text = (await response.content.read(_ERROR_BODY_LIMIT)).decode("utf-8", "replace")
+    logger.error("%s: %s - %s", message, response.status, error_text)
+
+# The wire format of /call. These are plain dicts at runtime, so requests
+# and responses are never copied into model objects
+class MCPRequest(TypedDict):
     method: str
     params: Dict[str, Any]
 
-class MCPResponse(BaseModel):
-    result: Optional[Dict[str, Any]] = None
-    error: Optional[str] = None
+class MCPResponse(TypedDict):
+    result: Optional[Dict[str, Any]]
+    error: Optional[str]
+
+class _RepoEndpoints:
+    """GitHub API URLs for one repository, with the repository part built once"""
+    __slots__ = ("issues", "pulls", "refs", "_issue_prefix", "_branch_ref_prefix", "_contents_prefix")
+    
+    def __init__(self, base_url: str, owner: str, repo: str):
+        root = f"{base_url}/repos/{owner}/{repo}"
+        self.issues = f"{root}/issues"
+        self.pulls = f"{root}/pulls"
+        self.refs = f"{root}/git/refs"
+        self._issue_prefix = f"{self.issues}/"
+        self._branch_ref_prefix = f"{root}/git/ref/heads/"
+        self._contents_prefix = f"{root}/contents/"
+    
+    def issue(self, issue_number: int) -> str:
+        return f"{self._issue_prefix}{issue_number}"
+    
+    def issue_comments(self, issue_number: int) -> str:
+        return f"{self._issue_prefix}{issue_number}/comments"
+    
+    def branch_ref(self, branch: str) -> str:
+        return self._branch_ref_prefix + branch
+    
+    def contents(self, path: str) -> str:
+        return self._contents_prefix + path
+
+@functools.lru_cache(maxsize=128)
+def _repo_endpoints(base_url: str, owner: str, repo: str) -> _RepoEndpoints:
+    """Get the endpoints of a repository, reused across calls for the same repository"""
+    return _RepoEndpoints(base_url, owner, repo)
+
+@functools.lru_cache(maxsize=64)
+def _issue_list_params(state: str, labels: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+    """Query parameters for listing issues, with the label list joined once per combination"""
+    if labels:
+        return (("state", state), ("labels", ",".join(labels)))
+    return (("state", state),)
+
+class GitHubRateLimiter:
+    """
+    Token bucket for GitHub API calls, kept in step with GitHub's rate limit headers
+    
+    Tokens refill at rate per second up to burst, which smooths bursts under
+    GitHub's secondary rate limits. The primary hourly quota is tracked from
+    the X-RateLimit-* headers of each response: tokens never exceed what GitHub
+    says remains, and once the quota is spent calls wait for it to reset.
+    """
+    
+    def __init__(self, rate: float = 15.0, burst: int = 100):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._remaining: Optional[int] = None
+        self._reset_at = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a call is allowed and take a token for it"""
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            if self._remaining == 0:
+                # X-RateLimit-Reset is in epoch seconds
+                delay = self._reset_at - time.time()
+                if delay > 0:
+                    logger.warning("GitHub rate limit exhausted, waiting %.0fs for reset", delay)
+                    await asyncio.sleep(delay)
+                self._remaining = None
+            
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    if self._remaining:
+                        self._remaining -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+    
+    def update_from_headers(self, headers):
+        """Sync the remaining quota to the X-RateLimit-* headers of a response"""
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            self._remaining = int(remaining)
+            self._reset_at = float(reset)
+        except ValueError:
+            return
+        self._tokens = min(self._tokens, self._remaining)
 
 class GitHubMCPServer:
     """Simple MCP server for GitHub operations"""
     
+    # Number of GitHub read responses kept for revalidation with their ETag
+    RESPONSE_CACHE_SIZE = 256
+    # Retries after a transient failure, and the backoff between them in seconds
+    MAX_RETRIES = 5
+    RETRY_BASE_DELAY = 0.5
+    RETRY_MAX_DELAY = 30.0
+    # Maximum number of GitHub calls a batch operation has in flight at once
+    MAX_CONCURRENT_CALLS = 64
+    
     def __init__(self, github_token: str):
         self.github_token = github_token
         self.base_url = "https://api.github.com"
         self.session: Optional[ClientSession] = None
+        # (url, params) -> (etag, last modified, body), least recently used first
+        self._cache: "OrderedDict[Tuple, Tuple[str, Optional[str], Any]]" = OrderedDict()
+        # (url, params) -> read in progress, shared by every concurrent caller
+        self._inflight: Dict[Tuple, "asyncio.Future[Tuple[int, Any, Optional[str]]]"] = {}
+        self._rate_limiter = GitHubRateLimiter()
+        self._batch_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_CALLS)
     
     async def __aenter__(self):
+        if self.session is not None and not self.session.closed:
+            # Already entered; keep the pooled connections
+            return self
+        
         headers = {
             "Authorization": f"token {self.github_token}",
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "GitHub-MCP-Server"
         }
-        self.session = ClientSession(headers=headers)
+        # One pool for every handler: connections to api.github.com are kept
+        # alive and the DNS answer cached, so calls skip the TLS handshake
+        connector = TCPConnector(
+            limit=0,
+            limit_per_host=64,
+            keepalive_timeout=75,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True
+        )
+        self.session = ClientSession(
+            headers=headers,
+            connector=connector,
+            timeout=ClientTimeout(total=30),
+            # aiohttp encodes the returned str itself, so this must not be bytes
+            json_serialize=_dumps_str
+        )
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.session:
             await self.session.close()
     
+    @contextlib.asynccontextmanager
+    async def _request(self, method: str, url: str, **kwargs) -> AsyncIterator[ClientResponse]:
+        """
+        Send a GitHub API request once the rate limiter allows it, retrying transient failures
+        
+        Rate limited requests (429, or 403 from a rate limit) were never applied,
+        so they are retried for any method. Gateway errors and dropped
+        connections are only retried for idempotent methods, since a POST may
+        have gone through. Retries back off exponentially with jitter, or wait
+        as long as GitHub's Retry-After asks.
+        """
+        if self.session is None or self.session.closed:
+            # The only session check: reopen rather than fail every call
+            logger.warning("GitHub session is closed, reopening it")
+            await self.__aenter__()
+        
+        idempotent = method in _IDEMPOTENT_METHODS
+        for attempt in range(self.MAX_RETRIES + 1):
+            last_attempt = attempt == self.MAX_RETRIES
+            await self._rate_limiter.acquire()
+            try:
+                response = await self.session.request(method, url, **kwargs)
+            except ClientConnectionError as e:
+                if last_attempt or not idempotent:
+                    raise
+                logger.warning("%s %s connection error, retrying: %s", method, url, e)
+                delay = None
+            else:
+                self._rate_limiter.update_from_headers(response.headers)
+                rate_limited = response.status == 429 or (
+                    response.status == 403 and (
+                        "Retry-After" in response.headers
+                        or response.headers.get("X-RateLimit-Remaining") == "0"
+                    )
+                )
+                retry = rate_limited or (idempotent and response.status in _RETRYABLE_STATUSES)
+                if not retry or last_attempt:
+                    try:
+                        yield response
+                    finally:
+                        response.release()
+                    return
+                
+                retry_after = response.headers.get("Retry-After")
+                delay = float(retry_after) if retry_after and retry_after.isdigit() else None
+                response.release()
+                logger.warning("%s %s returned %s, retrying", method, url, response.status)
+            
+            if delay is None:
+                delay = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** attempt)
+                delay += random.uniform(0, self.RETRY_BASE_DELAY)
+            await asyncio.sleep(delay)
+    
+    async def _conditional_get(self, url: str, params: Optional[Dict[str, Any]] = None,
+                               etag: Optional[str] = None) -> Tuple[int, Any, Optional[str]]:
+        """
+        GET a GitHub resource, revalidating the copy cached from the last read
+        
+        GitHub does not count 304 responses against the rate limit, so a
+        repeated read of an unchanged resource costs neither quota nor parsing.
+        Concurrent reads of the same resource share a single request.
+        
+        Args:
+            url: Resource URL
+            params: Query parameters
+            etag: ETag the caller already holds the resource under, if any
+            
+        Returns:
+            (status, body, etag): 200 with the body, 304 with no body if the
+            caller's etag is still current, or GitHub's error status with no body
+        """
+        key = (url, tuple(sorted(params.items())) if params else ())
+        
+        fetch = self._inflight.get(key)
+        if fetch is None:
+            fetch = asyncio.ensure_future(self._revalidate(key, url, params))
+            self._inflight[key] = fetch
+            fetch.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shielded so a caller giving up does not cancel the read for the others
+        status, body, new_etag = await asyncio.shield(fetch)
+        if status == 200 and etag is not None and etag == new_etag:
+            return 304, None, etag
+        return status, body, new_etag
+    
+    async def _revalidate(self, key: Tuple, url: str,
+                          params: Optional[Dict[str, Any]]) -> Tuple[int, Any, Optional[str]]:
+        """Fetch a resource, or confirm the cached copy is current; (status, body, etag)"""
+        cached = self._cache.get(key)
+        headers = {}
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
+            if cached[1]:
+                headers["If-Modified-Since"] = cached[1]
+        
+        async with self._request("GET", url, params=params, headers=headers) as response:
+            if response.status == 304 and cached is not None:
+                self._cache.move_to_end(key)
+                return 200, cached[2], cached[0]
+            
+            if response.status == 200:
+                body = _loads(await response.read())
+                new_etag = response.headers.get("ETag")
+                if new_etag:
+                    self._cache[key] = (new_etag, response.headers.get("Last-Modified"), body)
+                    self._cache.move_to_end(key)
+                    if len(self._cache) > self.RESPONSE_CACHE_SIZE:
+                        self._cache.popitem(last=False)
+                return 200, body, new_etag
+            
+            await _log_api_error(response)
+            return response.status, None, None
+    
     async def list_issues(self, owner: str, repo: str, labels: List[str] = None, state: str = "all") -> List[Dict[str, Any]]:
         """List issues from a GitHub repository"""
+        issues, _ = await self.list_issues_conditional(owner, repo, labels, state)
+        return issues if issues is not None else []
+    
+    async def list_issues_conditional(self, owner: str, repo: str, labels: List[str] = None, state: str = "all",
+                                      etag: Optional[str] = None, page: Optional[int] = None,
+                                      per_page: Optional[int] = None) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+        """
+        List issues, revalidating a previous response with its ETag
+        
+        page and per_page select a page of results; GitHub returns the first
+        30 issues when they are omitted.
+        
+        Returns:
+            (issues, etag) where issues is None if they are unchanged since etag
+        """
         try:
-            if not self.session or self.session.closed:
-                logger.error("Session is closed or not initialized")
-                return []
-            
-            url = f"{self.base_url}/repos/{owner}/{repo}/issues"
-            params = {"state": state}
+            url = _repo_endpoints(self.base_url, owner, repo).issues
+            params = dict(_issue_list_params(state, tuple(labels or ())))
+            if page:
+                params["page"] = page
+            if per_page:
+                params["per_page"] = per_page
             
-            if labels:
-                params["labels"] = ",".join(labels)
+            logger.info("Making request to: %s with params: %s", url, params)
             
-            logger.info(f"Making request to: {url} with params: {params}")
+            status, issues, new_etag = await self._conditional_get(url, params, etag)
+            if status == 304:
+                logger.info("Issues not modified since last request")
+                return None, etag
+            elif status == 200:
+                logger.info("Successfully retrieved %s issues", len(issues))
+                return issues, new_etag
+            else:
+                return [], None
+                    
+        except Exception as e:
+            logger.error("Error listing issues: %s", e)
+            return [], None
+    
+    async def iter_issue_pages(self, owner: str, repo: str, labels: List[str] = None, state: str = "all",
+                               per_page: int = 100) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Iterate over every page of issues, fetching the next page only when asked
+        
+        Only one page is held at a time, so callers can pass issues on as
+        they arrive rather than buffering the whole listing.
+        """
+        page = 1
+        while True:
+            issues, _ = await self.list_issues_conditional(owner, repo, labels, state,
+                                                           page=page, per_page=per_page)
+            if not issues:
+                return
+            yield issues
+            # A short page is the last one
+            if len(issues) < per_page:
+                return
+            page += 1
+    
+    async def list_all_issues(self, owner: str, repo: str, labels: List[str] = None, state: str = "all",
+                              per_page: int = 100) -> List[Dict[str, Any]]:
+        """
+        List every page of issues, fetching the pages after the first in parallel
+        
+        The first page's Link header gives the number of the last page, so the
+        remaining pages are requested together instead of one after another.
+        """
+        try:
+            url = _repo_endpoints(self.base_url, owner, repo).issues
+            params = dict(_issue_list_params(state, tuple(labels or ())))
+            params["per_page"] = per_page
             
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    issues = await response.json()
-                    logger.info(f"Successfully retrieved {len(issues)} issues")
-                    return issues
-                else:
-                    error_text = await response.text()
-                    logger.error(f"GitHub API error: {response.status} - {error_text}")
+            async with self._request("GET", url, params=params) as response:
+                if response.status != 200:
+                    await _log_api_error(response)
                     return []
-                    
+                issues = _loads(await response.read())
+                last = response.links.get("last")
+                last_page = int(last["url"].query.get("page", 1)) if last else 1
+            
+            async def fetch_page(page: int) -> List[Dict[str, Any]]:
+                async with self._batch_semaphore:
+                    page_issues, _ = await self.list_issues_conditional(
+                        owner, repo, labels, state, page=page, per_page=per_page
+                    )
+                    return page_issues or []
+            
+            pages = await asyncio.gather(*(fetch_page(page) for page in range(2, last_page + 1)))
+            for page_issues in pages:
+                issues.extend(page_issues)
+            
+            logger.info("Successfully retrieved %s issues from %s pages", len(issues), last_page)
+            return issues
+            
         except Exception as e:
-            logger.error(f"Error listing issues: {e}")
+            logger.error("Error listing all issues: %s", e)
             return []
     
     async def get_issue(self, owner: str, repo: str, issue_number: int) -> Optional[Dict[str, Any]]:
         """Get a specific issue from a GitHub repository"""
+        issue, _ = await self.get_issue_conditional(owner, repo, issue_number)
+        return issue
+    
+    async def get_issue_conditional(self, owner: str, repo: str, issue_number: int,
+                                    etag: Optional[str] = None) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Get an issue, revalidating a previous response with its ETag
+        
+        Returns:
+            (issue, etag); issue is None with the ETag set if it is unchanged
+            since etag, and None with no ETag if the request failed
+        """
         try:
-            if not self.session or self.session.closed:
-                logger.error("Session is closed or not initialized")
-                return None
-            
-            url = f"{self.base_url}/repos/{owner}/{repo}/issues/{issue_number}"
+            url = _repo_endpoints(self.base_url, owner, repo).issue(issue_number)
+            logger.info("Making request to: %s", url)
             
-            logger.info(f"Making request to: {url}")
-            
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    issue = await response.json()
-                    logger.info(f"Successfully retrieved issue #{issue_number}")
-                    return issue
-                else:
-                    error_text = await response.text()
-                    logger.error(f"GitHub API error: {response.status} - {error_text}")
-                    return None
+            status, issue, new_etag = await self._conditional_get(url, etag=etag)
+            if status == 304:
+                logger.info("Issue #%s not modified since last request", issue_number)
+                return None, etag
+            elif status == 200:
+                logger.info("Successfully retrieved issue #%s", issue_number)
+                return issue, new_etag
+            else:
+                return None, None
                     
         except Exception as e:
-            logger.error(f"Error getting issue: {e}")
-            return None
+            logger.error("Error getting issue: %s", e)
+            return None, None
     
     async def close_issue(self, owner: str, repo: str, issue_number: int, comment: str = None) -> bool:
         """Close an issue with an optional comment"""
         try:
-            if not self.session or self.session.closed:
-                logger.error("Session is closed or not initialized")
-                return False
-            
-            url = f"{self.base_url}/repos/{owner}/{repo}/issues/{issue_number}"
+            url = _repo_endpoints(self.base_url, owner, repo).issue(issue_number)
             
-            # Prepare the update data
-            update_data = {"state": "closed"}
+            logger.info("Closing issue #%s in %s/%s", issue_number, owner, repo)
             
-            logger.info(f"Closing issue #{issue_number} in {owner}/{repo}")
-            
-            async with self.session.patch(url, json=update_data) as response:
+            async with self._request("PATCH", url, data=_CLOSE_ISSUE_BODY, headers=_JSON_HEADERS) as response:
                 if response.status == 200:
-                    logger.info(f"Successfully closed issue #{issue_number}")
+                    logger.info("Successfully closed issue #%s", issue_number)
                     
                     # Add a comment if provided
                     if comment:
@@ -115,47 +468,104 @@ class GitHubMCPServer:
                     
                     return True
                 else:
-                    error_text = await response.text()
-                    logger.error(f"GitHub API error: {response.status} - {error_text}")
+                    await _log_api_error(response)
                     return False
                     
         except Exception as e:
-            logger.error(f"Error closing issue: {e}")
+            logger.error("Error closing issue: %s", e)
             return False
     
+    async def close_issues(self, owner: str, repo: str, issue_numbers: List[int],
+                           comment: str = None) -> List[bool]:
+        """
+        Close several issues concurrently, each with the same optional comment
+        
+        Returns:
+            Success flag for each issue, in order
+        """
+        async def close_one(issue_number: int) -> bool:
+            async with self._batch_semaphore:
+                return await self.close_issue(owner, repo, issue_number, comment)
+        
+        return list(await asyncio.gather(*(close_one(issue_number) for issue_number in issue_numbers)))
+    
     async def add_issue_comment(self, owner: str, repo: str, issue_number: int, comment: str) -> bool:
         """Add a comment to an issue"""
         try:
-            if not self.session or self.session.closed:
-                logger.error("Session is closed or not initialized")
-                return False
-            
-            url = f"{self.base_url}/repos/{owner}/{repo}/issues/{issue_number}/comments"
+            url = _repo_endpoints(self.base_url, owner, repo).issue_comments(issue_number)
             
-            logger.info(f"Adding comment to issue #{issue_number}")
+            logger.info("Adding comment to issue #%s", issue_number)
             
-            async with self.session.post(url, json={"body": comment}) as response:
+            async with self._request("POST", url, json={"body": comment}) as response:
                 if response.status == 201:
-                    logger.info(f"Successfully added comment to issue #{issue_number}")
+                    logger.info("Successfully added comment to issue #%s", issue_number)
                     return True
                 else:
-                    error_text = await response.text()
-                    logger.error(f"GitHub API error: {response.status} - {error_text}")
+                    await _log_api_error(response)
                     return False
                     
         except Exception as e:
-            logger.error(f"Error adding comment: {e}")
+            logger.error("Error adding comment: %s", e)
             return False
     
+    async def add_issue_comments(self, owner: str, repo: str, comments: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Add several issue comments with a single GraphQL mutation
+        
+        Each comment needs an issue_number and comment; comments that also carry
+        the issue's node_id are batched, the rest fall back to the REST endpoint.
+        
+        Returns:
+            Success flag for each comment, in order
+        """
+        results = [False] * len(comments)
+        batched = [i for i, comment in enumerate(comments) if comment.get("node_id")]
+        unbatched = [i for i, comment in enumerate(comments) if not comment.get("node_id")]
+        
+        if unbatched:
+            rest_results = await asyncio.gather(*(
+                self.add_issue_comment(owner, repo, comments[i]["issue_number"], comments[i]["comment"])
+                for i in unbatched
+            ))
+            for i, success in zip(unbatched, rest_results):
+                results[i] = success
+        
+        if not batched:
+            return results
+        
+        try:
+            # Alias each addComment so the response reports every comment separately
+            declarations = []
+            fields = []
+            variables = {}
+            for n, i in enumerate(batched):
+                declarations.append(f"$subject{n}: ID!, $body{n}: String!")
+                fields.append(f"c{n}: addComment(input: {{subjectId: $subject{n}, body: $body{n}}}) {{ clientMutationId }}")
+                variables[f"subject{n}"] = comments[i]["node_id"]
+                variables[f"body{n}"] = comments[i]["comment"]
+            query = f"mutation({', '.join(declarations)}) {{ {' '.join(fields)} }}"
+            
+            logger.info("Adding %s comments in one GraphQL request", len(batched))
+            
+            async with self._request("POST", f"{self.base_url}/graphql", json={"query": query, "variables": variables}) as response:
+                if response.status == 200:
+                    data = _loads(await response.read()).get("data") or {}
+                    for n, i in enumerate(batched):
+                        results[i] = data.get(f"c{n}") is not None
+                    logger.info("Successfully added %s of %s comments", sum(results), len(comments))
+                else:
+                    await _log_api_error(response)
+                    
+        except Exception as e:
+            logger.error("Error adding comments: %s", e)
+        
+        return results
+    
     async def create_pull_request(self, owner: str, repo: str, title: str, body: str, 
                                  head: str, base: str = "main") -> Optional[Dict[str, Any]]:
         """Create a pull request"""
         try:
-            if not self.session or self.session.closed:
-                logger.error("Session is closed or not initialized")
-                return None
-            
-            url = f"{self.base_url}/repos/{owner}/{repo}/pulls"
+            url = _repo_endpoints(self.base_url, owner, repo).pulls
             
             pr_data = {
                 "title": title,
@@ -164,70 +574,55 @@ class GitHubMCPServer:
                 "base": base
             }
             
-            logger.info(f"Creating pull request in {owner}/{repo}")
+            logger.info("Creating pull request in %s/%s", owner, repo)
             
-            async with self.session.post(url, json=pr_data) as response:
+            async with self._request("POST", url, json=pr_data) as response:
                 if response.status == 201:
-                    pr = await response.json()
-                    logger.info(f"Successfully created pull request #{pr['number']}")
+                    pr = _loads(await response.read())
+                    logger.info("Successfully created pull request #%s", pr['number'])
                     return pr
                 else:
-                    error_text = await response.text()
-                    logger.error(f"GitHub API error: {response.status} - {error_text}")
+                    await _log_api_error(response)
                     return None
                     
         except Exception as e:
-            logger.error(f"Error creating pull request: {e}")
+            logger.error("Error creating pull request: %s", e)
             return None
     
     async def create_branch(self, owner: str, repo: str, branch_name: str, base_branch: str = "main") -> bool:
         """Create a new branch from the base branch"""
         try:
-            if not self.session or self.session.closed:
-                logger.error("Session is closed or not initialized")
+            # First, get the SHA of the base branch. The base rarely moves, so
+            # this is usually a 304 answered from the cached ref
+            endpoints = _repo_endpoints(self.base_url, owner, repo)
+            status, ref_data, _ = await self._conditional_get(endpoints.branch_ref(base_branch))
+            if status != 200:
+                logger.error("Could not get base branch %s: %s", base_branch, status)
                 return False
             
-            # First, get the SHA of the base branch
-            ref_url = f"{self.base_url}/repos/{owner}/{repo}/git/ref/heads/{base_branch}"
+            # Create the new branch
+            branch_data = {
+                "ref": f"refs/heads/{branch_name}",
+                "sha": ref_data['object']['sha']
+            }
             
-            async with self.session.get(ref_url) as response:
-                if response.status == 200:
-                    ref_data = await response.json()
-                    sha = ref_data['object']['sha']
-                    
-                    # Create the new branch
-                    create_url = f"{self.base_url}/repos/{owner}/{repo}/git/refs"
-                    branch_data = {
-                        "ref": f"refs/heads/{branch_name}",
-                        "sha": sha
-                    }
-                    
-                    async with self.session.post(create_url, json=branch_data) as create_response:
-                        if create_response.status == 201:
-                            logger.info(f"Successfully created branch {branch_name}")
-                            return True
-                        else:
-                            error_text = await create_response.text()
-                            logger.error(f"GitHub API error creating branch: {create_response.status} - {error_text}")
-                            return False
+            async with self._request("POST", endpoints.refs, json=branch_data) as response:
+                if response.status == 201:
+                    logger.info("Successfully created branch %s", branch_name)
+                    return True
                 else:
-                    error_text = await response.text()
-                    logger.error(f"GitHub API error getting base branch: {response.status} - {error_text}")
+                    await _log_api_error(response, "GitHub API error creating branch")
                     return False
                     
         except Exception as e:
-            logger.error(f"Error creating branch: {e}")
+            logger.error("Error creating branch: %s", e)
             return False
     
     async def create_file(self, owner: str, repo: str, path: str, content: str, 
                          branch: str, message: str) -> bool:
         """Create a file in the repository"""
         try:
-            if not self.session or self.session.closed:
-                logger.error("Session is closed or not initialized")
-                return False
-            
-            url = f"{self.base_url}/repos/{owner}/{repo}/contents/{path}"
+            url = _repo_endpoints(self.base_url, owner, repo).contents(path)
             
             file_data = {
                 "message": message,
@@ -235,137 +630,255 @@ class GitHubMCPServer:
                 "branch": branch
             }
             
-            logger.info(f"Creating file {path} in {owner}/{repo}")
+            logger.info("Creating file %s in %s/%s", path, owner, repo)
             
-            async with self.session.put(url, json=file_data) as response:
+            async with self._request("PUT", url, json=file_data) as response:
                 if response.status == 201:
-                    logger.info(f"Successfully created file {path}")
+                    logger.info("Successfully created file %s", path)
                     return True
                 else:
-                    error_text = await response.text()
-                    logger.error(f"GitHub API error: {response.status} - {error_text}")
+                    await _log_api_error(response)
                     return False
                     
         except Exception as e:
-            logger.error(f"Error creating file: {e}")
+            logger.error("Error creating file: %s", e)
             return False
 
+def _json_response(body: MCPResponse, status: int = 200) -> web.Response:
+    """Serialise an MCP response body"""
+    return web.Response(body=_dumps(body), status=status, content_type="application/json")
+
 class MCPHandler:
     """Handler for MCP server requests"""
     
     def __init__(self, github_server: GitHubMCPServer):
         self.github_server = github_server
+        # MCP method name -> coroutine taking the call's params and returning its result
+        self._methods: Dict[str, Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]] = {
+            "github.list_issues": self._list_issues,
+            "github.get_issue": self._get_issue,
+            "github.close_issue": self._close_issue,
+            "github.close_issues": self._close_issues,
+            "github.add_issue_comment": self._add_issue_comment,
+            "github.add_issue_comments": self._add_issue_comments,
+            "github.create_pull_request": self._create_pull_request,
+            "github.create_branch": self._create_branch,
+            "github.create_file": self._create_file
+        }
+    
+    async def handle_stream(self, request: web.Request) -> web.StreamResponse:
+        """
+        Handle MCP calls whose results are streamed as newline-delimited JSON
+        
+        Only github.list_issues is streamed: every matching issue is sent as
+        one JSON line, a page at a time as GitHub returns them, so clients
+        can start on the first issues before the last page is fetched.
+        """
+        try:
+            data = _loads(await request.read())
+            method = data.get("method")
+            params = data.get("params")
+            if not isinstance(params, dict):
+                raise ValueError("MCP request needs a params object")
+            if method != "github.list_issues":
+                return _json_response({"result": None, "error": f"Method cannot be streamed: {method}"}, status=400)
+        except Exception as e:
+            logger.error("Error handling MCP stream call: %s", e)
+            return _json_response({"result": None, "error": str(e)}, status=500)
+        
+        response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+        await response.prepare(request)
+        
+        try:
+            async for issues in self.github_server.iter_issue_pages(
+                owner=params["owner"],
+                repo=params["repo"],
+                labels=params.get("labels", []),
+                state=params.get("state", "all"),
+                per_page=params.get("per_page") or 100
+            ):
+                await response.write(b"".join(_dumps(issue) + b"\n" for issue in issues))
+        except Exception as e:
+            # The status line is already sent; ending the stream early is all
+            # that is left to signal the failure
+            logger.error("Error streaming issues: %s", e)
+        
+        await response.write_eof()
+        return response
     
     async def handle_call(self, request: web.Request) -> web.Response:
         """Handle MCP call requests"""
         try:
-            data = await request.json()
-            mcp_request = MCPRequest(**data)
+            data = _loads(await request.read())
+            method = data.get("method")
+            params = data.get("params")
+            if not isinstance(method, str) or not isinstance(params, dict):
+                raise ValueError("MCP request needs a string method and a params object")
             
-            if mcp_request.method == "github.list_issues":
-                result = await self.github_server.list_issues(
-                    owner=mcp_request.params["owner"],
-                    repo=mcp_request.params["repo"],
-                    labels=mcp_request.params.get("labels", []),
-                    state=mcp_request.params.get("state", "all")
-                )
-                
-                response = MCPResponse(result={"issues": result})
-                
-            elif mcp_request.method == "github.get_issue":
-                result = await self.github_server.get_issue(
-                    owner=mcp_request.params["owner"],
-                    repo=mcp_request.params["repo"],
-                    issue_number=mcp_request.params["issue_number"]
-                )
-                
-                response = MCPResponse(result={"issue": result})
-                
-            elif mcp_request.method == "github.close_issue":
-                result = await self.github_server.close_issue(
-                    owner=mcp_request.params["owner"],
-                    repo=mcp_request.params["repo"],
-                    issue_number=mcp_request.params["issue_number"],
-                    comment=mcp_request.params.get("comment")
-                )
-                
-                response = MCPResponse(result={"success": result})
-                
-            elif mcp_request.method == "github.add_issue_comment":
-                result = await self.github_server.add_issue_comment(
-                    owner=mcp_request.params["owner"],
-                    repo=mcp_request.params["repo"],
-                    issue_number=mcp_request.params["issue_number"],
-                    comment=mcp_request.params["comment"]
-                )
-                
-                response = MCPResponse(result={"success": result})
-                
-            elif mcp_request.method == "github.create_pull_request":
-                result = await self.github_server.create_pull_request(
-                    owner=mcp_request.params["owner"],
-                    repo=mcp_request.params["repo"],
-                    title=mcp_request.params["title"],
-                    body=mcp_request.params["body"],
-                    head=mcp_request.params["head"],
-                    base=mcp_request.params.get("base", "main")
-                )
-                
-                response = MCPResponse(result={"pull_request": result})
-                
-            elif mcp_request.method == "github.create_branch":
-                result = await self.github_server.create_branch(
-                    owner=mcp_request.params["owner"],
-                    repo=mcp_request.params["repo"],
-                    branch_name=mcp_request.params["branch_name"],
-                    base_branch=mcp_request.params.get("base_branch", "main")
-                )
-                
-                response = MCPResponse(result={"success": result})
-                
-            elif mcp_request.method == "github.create_file":
-                result = await self.github_server.create_file(
-                    owner=mcp_request.params["owner"],
-                    repo=mcp_request.params["repo"],
-                    path=mcp_request.params["path"],
-                    content=mcp_request.params["content"],
-                    branch=mcp_request.params["branch"],
-                    message=mcp_request.params["message"]
-                )
-                
-                response = MCPResponse(result={"success": result})
-                
-            else:
-                response = MCPResponse(error=f"Unknown method: {mcp_request.method}")
+            handler = self._methods.get(method)
+            if handler is None:
+                return _json_response({"result": None, "error": f"Unknown method: {method}"})
             
-            return web.json_response(response.dict())
+            return _json_response({"result": await handler(params), "error": None})
             
         except Exception as e:
-            logger.error(f"Error handling MCP call: {e}")
-            response = MCPResponse(error=str(e))
-            return web.json_response(response.dict(), status=500)
+            logger.error("Error handling MCP call: %s", e)
+            return _json_response({"result": None, "error": str(e)}, status=500)
+    
+    async def _list_issues(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        if params.get("all_pages"):
+            result = await self.github_server.list_all_issues(
+                owner=params["owner"],
+                repo=params["repo"],
+                labels=params.get("labels", []),
+                state=params.get("state", "all"),
+                per_page=params.get("per_page") or 100
+            )
+            return {"issues": result, "etag": None, "not_modified": False}
+        
+        result, etag = await self.github_server.list_issues_conditional(
+            owner=params["owner"],
+            repo=params["repo"],
+            labels=params.get("labels", []),
+            state=params.get("state", "all"),
+            etag=params.get("etag"),
+            page=params.get("page"),
+            per_page=params.get("per_page")
+        )
+        return {
+            "issues": result if result is not None else [],
+            "etag": etag,
+            "not_modified": result is None
+        }
+    
+    async def _get_issue(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        result, etag = await self.github_server.get_issue_conditional(
+            owner=params["owner"],
+            repo=params["repo"],
+            issue_number=params["issue_number"],
+            etag=params.get("etag")
+        )
+        return {
+            "issue": result,
+            "etag": etag,
+            "not_modified": result is None and etag is not None
+        }
+    
+    async def _close_issue(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        result = await self.github_server.close_issue(
+            owner=params["owner"],
+            repo=params["repo"],
+            issue_number=params["issue_number"],
+            comment=params.get("comment")
+        )
+        return {"success": result}
+    
+    async def _close_issues(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        results = await self.github_server.close_issues(
+            owner=params["owner"],
+            repo=params["repo"],
+            issue_numbers=params["issue_numbers"],
+            comment=params.get("comment")
+        )
+        return {"results": results}
+    
+    async def _add_issue_comment(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        result = await self.github_server.add_issue_comment(
+            owner=params["owner"],
+            repo=params["repo"],
+            issue_number=params["issue_number"],
+            comment=params["comment"]
+        )
+        return {"success": result}
+    
+    async def _add_issue_comments(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        results = await self.github_server.add_issue_comments(
+            owner=params["owner"],
+            repo=params["repo"],
+            comments=params["comments"]
+        )
+        return {"results": results}
+    
+    async def _create_pull_request(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        result = await self.github_server.create_pull_request(
+            owner=params["owner"],
+            repo=params["repo"],
+            title=params["title"],
+            body=params["body"],
+            head=params["head"],
+            base=params.get("base", "main")
+        )
+        return {"pull_request": result}
+    
+    async def _create_branch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        result = await self.github_server.create_branch(
+            owner=params["owner"],
+            repo=params["repo"],
+            branch_name=params["branch_name"],
+            base_branch=params.get("base_branch", "main")
+        )
+        return {"success": result}
+    
+    async def _create_file(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        result = await self.github_server.create_file(
+            owner=params["owner"],
+            repo=params["repo"],
+            path=params["path"],
+            content=params["content"],
+            branch=params["branch"],
+            message=params["message"]
+        )
+        return {"success": result}
+
+HANDLER_KEY = web.AppKey("handler", MCPHandler)
+GITHUB_SERVER_KEY = web.AppKey("github_server", GitHubMCPServer)
+
+async def _health(request: web.Request) -> web.Response:
+    """Answer liveness checks"""
+    return web.Response(text="ok")
+
+_shared_server: Optional[GitHubMCPServer] = None
+
+async def get_shared_server(github_token: str) -> GitHubMCPServer:
+    """
+    Get the process-wide GitHubMCPServer, creating it on first use
+    
+    Sharing one instance means one session and one connection pool to
+    GitHub, rather than a new TLS handshake for every server created.
+    """
+    global _shared_server
+    if _shared_server is None or _shared_server.github_token != github_token:
+        _shared_server = GitHubMCPServer(github_token)
+    # Opens the session, or reopens it if the server was shut down
+    await _shared_server.__aenter__()
+    return _shared_server
 
 async def create_mcp_server(github_token: str, host: str = "localhost", port: int = 3000):
     """Create and start the MCP server"""
     app = web.Application()
     
-    # Create GitHub server without context manager to keep session alive
-    github_server = GitHubMCPServer(github_token)
-    await github_server.__aenter__()  # Initialize the session
+    # Entered without a context manager to keep the session alive
+    github_server = await get_shared_server(github_token)
     
     handler = MCPHandler(github_server)
-    app["handler"] = handler
-    app["github_server"] = github_server  # Store for cleanup
+    app[HANDLER_KEY] = handler
+    app[GITHUB_SERVER_KEY] = github_server  # Store for cleanup
     
-    app.router.add_post("/call", lambda req: app["handler"].handle_call(req))
+    # Bound methods go straight to the router, with no wrapper per request
+    app.router.add_post("/call", handler.handle_call)
+    app.router.add_post("/call/stream", handler.handle_stream)
+    # Lets clients open and pool a connection before their first call
+    app.router.add_get("/health", _health)
     
-    runner = web.AppRunner(app)
+    # Keep client connections open between calls; GitHubMCPClient drops its
+    # idle connections before this expires
+    runner = web.AppRunner(app, keepalive_timeout=75)
     await runner.setup()
     
     site = web.TCPSite(runner, host, port)
     await site.start()
     
-    logger.info(f"MCP Server running on http://{host}:{port}")
+    logger.info("MCP Server running on http://%s:%s", host, port)
     
     return runner, github_server
 
@@ -381,11 +894,18 @@ async def main():
     
     runner, github_server = await create_mcp_server(github_token, host, port)
     
+    # Park until SIGINT or SIGTERM rather than waking up to poll
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            # Not supported on Windows; Ctrl+C still interrupts asyncio.run
+            pass
+    
     try:
-        # Keep the server running
-        while True:
-            await asyncio.sleep(1)
-    except KeyboardInterrupt:
+        await stop.wait()
         logger.info("Shutting down MCP server...")
     finally:
         # Clean up resources
@@ -394,4 +914,13 @@ async def main():
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
+    
+    # Use uvloop's faster event loop when available; fall back to the default
+    # asyncio loop where it isn't installed or supported (e.g. Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(main()) 
\ No newline at end of file
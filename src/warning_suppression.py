@@ -7,8 +7,16 @@ import warnings
 import logging
 from typing import Optional
 
+# Set once the filters are installed so repeated calls are no-ops
+_SUPPRESSED = False
+
 def suppress_warnings():
     """Suppress common warnings that don't affect functionality"""
+    global _SUPPRESSED
+    
+    if _SUPPRESSED:
+        return
+    _SUPPRESSED = True
     
     # Suppress urllib3 SSL warnings
     warnings.filterwarnings(
@@ -4,8 +4,6 @@ Test to demonstrate how the Senior Developer Agent takes action on GitHub issues
 """
 
 import asyncio
-import os
-import sys
 import warnings
 from dotenv import load_dotenv
 
@@ -13,9 +11,6 @@ from dotenv import load_dotenv
 warnings.filterwarnings("ignore", category=UserWarning)
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
-# Add the parent directory to the path so we can import from src
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 from src.crew_agents import SeniorDeveloperAgent
 from src.github_mcp_client import GitHubIssue
 
@@ -4,7 +4,6 @@ Test to verify the Crew AI fix works correctly
 """
 
 import asyncio
-import os
 import sys
 import warnings
 from dotenv import load_dotenv
@@ -13,9 +12,6 @@ from dotenv import load_dotenv
 warnings.filterwarnings("ignore", category=UserWarning)
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
-# Add the parent directory to the path so we can import from src
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 from src.crew_agents import SeniorDeveloperAgent, GitHubIssueAgent
 from src.github_mcp_client import GitHubMCPClient
 
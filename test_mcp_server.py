@@ -31,13 +31,20 @@ async def test_mcp_server():
         # Mock the GitHub token
         server = GitHubMCPServer("test_token")
         
-        # Test session initialization
-        await server.__aenter__()
-        print("✅ Session initialized successfully")
-        
-        # Test session cleanup
-        await server.__aexit__(None, None, None)
-        print("✅ Session cleaned up successfully")
+        # Only the context manager protocol is under test, so skip building
+        # a real session and connector pool (SSL context, DNS resolver)
+        with patch("src.mcp_server.ClientSession") as session_class, \
+             patch("src.mcp_server.TCPConnector"):
+            session_class.return_value = AsyncMock(closed=False)
+            
+            # Test session initialization
+            await server.__aenter__()
+            print("✅ Session initialized successfully")
+            
+            # Test session cleanup
+            await server.__aexit__(None, None, None)
+            session_class.return_value.close.assert_awaited_once()
+            print("✅ Session cleaned up successfully")
         
     except Exception as e:
         print(f"❌ Failed to test session management: {e}")
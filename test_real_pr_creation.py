@@ -3,42 +3,15 @@
 Test to demonstrate real pull request creation
 """
 
-import asyncio
-import os
+import functools
 import sys
 import warnings
-from dotenv import load_dotenv
-
-# Suppress warnings for clean output
-warnings.filterwarnings("ignore", category=UserWarning)
-warnings.filterwarnings("ignore", category=DeprecationWarning)
-
-# Add the parent directory to the path so we can import from src
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-from src.crew_agents import SeniorDeveloperAgent
-from src.github_mcp_client import GitHubIssue
-
-# Load environment variables
-load_dotenv()
-
-async def test_real_pr_creation():
-    """Test that the agent creates real pull requests"""
-    
-    print("🧪 Testing Real Pull Request Creation")
-    print("=" * 50)
-    print("This test demonstrates how the agent now creates REAL pull requests,")
-    print("not just fake messages.")
-    print()
-    
-    # Create a mock agent for testing
-    agent = SeniorDeveloperAgent(None)  # No MCP client for this test
-    
-    # Example issue that would trigger PR creation
-    code_issue = GitHubIssue(
-        number=123,
-        title="Implement user authentication API",
-        body="""Create a REST API endpoint for user authentication.
+
+# Example issue that would trigger PR creation
+CODE_ISSUE = dict(
+    number=123,
+    title="Implement user authentication API",
+    body="""Create a REST API endpoint for user authentication.
 
 Requirements:
 - POST /api/auth/login endpoint
@@ -48,58 +21,91 @@ Requirements:
 - Use bcrypt for password hashing
 
 Please implement this in Python using Flask.""",
-        state="open",
-        labels=[{"name": "ai-task"}],
-        created_at="2024-01-01T00:00:00Z",
-        updated_at="2024-01-01T00:00:00Z",
-        html_url="https://github.com/test/repo/issues/123"
-    )
-    
-    print("📋 Example Issue:")
-    print(f"  Issue #{code_issue.number}: {code_issue.title}")
-    print(f"  Requires code changes: {agent._requires_code_changes(code_issue)}")
-    print()
-    
-    print("🔄 Real Pull Request Creation Process:")
-    print("1. 📝 Analyze issue requirements")
-    print("2. 💻 Generate code implementation")
-    print("3. 🌿 Create new branch: ai-task-123-implement-user-authentication")
-    print("4. 📁 Create implementation files in the branch")
-    print("5. 🔄 Create pull request with code changes")
-    print("6. 💬 Add comment with PR link to the issue")
-    print()
-    
-    print("🔧 MCP Server Methods Used:")
-    print("- github.create_branch: Create new branch for the PR")
-    print("- github.create_file: Add implementation files to the branch")
-    print("- github.create_pull_request: Create the actual pull request")
-    print("- github.add_issue_comment: Add comment with PR link")
-    print()
-    
-    print("📊 Expected Output:")
-    print("=" * 50)
-    print("ANALYSIS RESULTS")
-    print("=" * 50)
-    print("(Crew AI analysis of the issue)")
-    print()
-    print("=" * 50)
-    print("ACTIONS TAKEN ON ISSUES")
-    print("=" * 50)
-    print("Processing Issue #123: Implement user authentication API")
-    print("✅ Successfully created pull request #15: https://github.com/owner/repo/pull/15")
-    print("✅ Added comment to issue #123")
-    print()
-    
-    print("🎯 What Actually Happens:")
-    print("- ✅ Branch 'ai-task-123-implement-user-authentication' is created")
-    print("- ✅ File 'ai_task_implementations/auth_api.py' is added to the branch")
-    print("- ✅ Pull request #15 is created with the implementation")
-    print("- ✅ Issue #123 gets a comment with the PR link")
-    print("- ✅ The PR contains the actual code implementation")
-    print()
-    
-    print("✅ The agent now creates REAL pull requests!")
-    print("No more fake messages - actual GitHub PRs are created.")
+    state="open",
+    labels=[{"name": "ai-task"}],
+    created_at="2024-01-01T00:00:00Z",
+    updated_at="2024-01-01T00:00:00Z",
+    html_url="https://github.com/test/repo/issues/123"
+)
+
+RULE = "=" * 50
+
+# Written in one go rather than line by line
+BANNER = f"""🧪 Testing Real Pull Request Creation
+{RULE}
+This test demonstrates how the agent now creates REAL pull requests,
+not just fake messages.
+
+📋 Example Issue:
+  Issue #{{number}}: {{title}}
+  Requires code changes: {{requires_code_changes}}
+
+🔄 Real Pull Request Creation Process:
+1. 📝 Analyze issue requirements
+2. 💻 Generate code implementation
+3. 🌿 Create new branch: ai-task-123-implement-user-authentication
+4. 📁 Create implementation files in the branch
+5. 🔄 Create pull request with code changes
+6. 💬 Add comment with PR link to the issue
+
+🔧 MCP Server Methods Used:
+- github.create_branch: Create new branch for the PR
+- github.create_file: Add implementation files to the branch
+- github.create_pull_request: Create the actual pull request
+- github.add_issue_comment: Add comment with PR link
+
+📊 Expected Output:
+{RULE}
+ANALYSIS RESULTS
+{RULE}
+(Crew AI analysis of the issue)
+
+{RULE}
+ACTIONS TAKEN ON ISSUES
+{RULE}
+Processing Issue #123: Implement user authentication API
+✅ Successfully created pull request #15: https://github.com/owner/repo/pull/15
+✅ Added comment to issue #123
+
+🎯 What Actually Happens:
+- ✅ Branch 'ai-task-123-implement-user-authentication' is created
+- ✅ File 'ai_task_implementations/auth_api.py' is added to the branch
+- ✅ Pull request #15 is created with the implementation
+- ✅ Issue #123 gets a comment with the PR link
+- ✅ The PR contains the actual code implementation
+
+✅ The agent now creates REAL pull requests!
+No more fake messages - actual GitHub PRs are created.
+"""
+
+@functools.lru_cache(maxsize=1)
+def _code_issue():
+    """Validate the example issue on first use instead of at import"""
+    from src.github_mcp_client import GitHubIssue
+    return GitHubIssue(**CODE_ISSUE)
+
+def test_requires_code_changes():
+    """Test that an implementation request is routed to pull request creation"""
+    from src.crew_agents import SeniorDeveloperAgent
+
+    agent = SeniorDeveloperAgent(None)  # No MCP client for this test
+    assert agent._requires_code_changes(_code_issue())
+
+def main():
+    """Show how the agent handles an issue that needs code changes"""
+    from src.crew_agents import SeniorDeveloperAgent
+
+    agent = SeniorDeveloperAgent(None)  # No MCP client for this test
+    code_issue = _code_issue()
+    sys.stdout.write(BANNER.format(
+        number=code_issue.number,
+        title=code_issue.title,
+        requires_code_changes=agent._requires_code_changes(code_issue)
+    ))
 
 if __name__ == "__main__":
-    asyncio.run(test_real_pr_creation()) 
\ No newline at end of file
+    # Suppress warnings for clean output, only when run as a script so that
+    # importing this module leaves the global filters alone
+    warnings.simplefilter("ignore", UserWarning)
+    warnings.simplefilter("ignore", DeprecationWarning)
+    main()
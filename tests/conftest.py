@@ -0,0 +1,11 @@
+"""
+Shared pytest setup for the AI Dev Agents tests
+"""
+
+import os
+import sys
+
+# Make the project root importable once for the whole test session
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
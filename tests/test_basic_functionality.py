@@ -5,15 +5,61 @@ Basic tests for AI Dev Agents functionality
 
 import unittest
 import asyncio
+import json
 import os
+import time
 import sys
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
-# Add the parent directory to the path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add the parent directory to the path when run directly; under pytest
+# conftest.py has already done this
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
 
-from src.github_mcp_client import GitHubMCPClient, GitHubIssue
-from src.crew_agents import GitHubIssueAgent, SeniorDeveloperAgent
+from src.github_mcp_client import GitHubMCPClient, GitHubIssue, Label, _encode_payload, _parse_issue, _parse_issues
+
+# Issue data as the MCP server returns it, shared by the tests that mock it
+ISSUE_123 = {
+    "number": 123,
+    "title": "Test Issue 1",
+    "body": "Test body 1",
+    "state": "open",
+    "labels": [{"name": "bug"}],
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+    "html_url": "https://github.com/test/repo/issues/123"
+}
+
+ISSUE_124 = {
+    **ISSUE_123,
+    "number": 124,
+    "title": "Test Issue 2",
+    "body": "Test body 2",
+    "labels": [{"name": "feature"}],
+    "html_url": "https://github.com/test/repo/issues/124"
+}
+
+# Shared fields for issues built straight from hand-written test data
+_ISSUE_DEFAULTS = {
+    "title": "",
+    "body": "",
+    "state": "open",
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+}
+
+def _make_issue(number, labels=(), **fields):
+    """Build a GitHubIssue without validation, for inputs known to be good"""
+    return GitHubIssue.model_construct(
+        number=number,
+        labels=tuple(Label.model_construct(name=name) for name in labels),
+        html_url=f"https://github.com/test/repo/issues/{number}",
+        **{**_ISSUE_DEFAULTS, **fields}
+    )
+
+class _StubMCPClient:
+    """MCP client stand-in for agents whose client is never called or inspected"""
 
 class TestGitHubMCPClient(unittest.TestCase):
     """Test the GitHub MCP Client"""
@@ -33,109 +79,383 @@ class TestGitHubMCPClient(unittest.TestCase):
         
         issue = GitHubIssue(**issue_data)
         
-        self.assertEqual(issue.number, 123)
-        self.assertEqual(issue.title, "Test Issue")
-        self.assertEqual(issue.state, "open")
-        self.assertEqual(len(issue.labels), 2)
-    
-    @patch('aiohttp.ClientSession')
-    async def test_get_issues_by_label(self, mock_session):
-        """Test getting issues by label"""
-        # Mock response data
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.json = AsyncMock(return_value={
-            "result": {
-                "issues": [
-                    {
-                        "number": 123,
-                        "title": "Test Issue",
-                        "body": "Test body",
-                        "state": "open",
-                        "labels": [{"name": "bug"}],
-                        "created_at": "2024-01-01T00:00:00Z",
-                        "updated_at": "2024-01-01T00:00:00Z",
-                        "html_url": "https://github.com/test/repo/issues/123"
-                    }
-                ]
-            }
-        })
-        
-        mock_session.return_value.__aenter__.return_value.post.return_value.__aenter__.return_value = mock_response
-        
-        client = GitHubMCPClient("http://localhost:3000")
-        issues = await client.get_issues_by_label("test/repo", "bug")
-        
+        self.assertEqual(
+            (issue.number, issue.title, issue.state, len(issue.labels)),
+            (123, "Test Issue", "open", 2)
+        )
+
+    def test_github_issue_label_names(self):
+        """Test GitHubIssue label names formatting"""
+        issue = GitHubIssue(
+            number=1,
+            title="Labelled Issue",
+            body="",
+            state="open",
+            labels=[{"name": "bug"}, {"name": "high-priority"}],
+            created_at="2024-01-01T00:00:00Z",
+            updated_at="2024-01-01T00:00:00Z",
+            html_url="https://github.com/test/repo/issues/1"
+        )
+
+        self.assertEqual(issue.label_names, "bug, high-priority")
+        self.assertEqual(issue.search_text, "Labelled Issue ")
+
+    def test_github_issue_derived_fields_track_copies(self):
+        """Test that reading derived fields leaves equality and copies alone"""
+        issue = GitHubIssue(**ISSUE_123)
+        self.assertEqual(issue.label_names, "bug")
+        self.assertEqual(issue, GitHubIssue(**ISSUE_123))
+        self.assertEqual(hash(issue), hash(GitHubIssue(**ISSUE_123)))
+
+        copy = issue.model_copy(update={"title": "New", "labels": ()})
+        self.assertEqual((copy.label_names, copy.search_text), ("", "New Test body 1"))
+
+    def test_parse_issue_from_server_data(self):
+        """Test building issues from trusted MCP server data"""
+        issue_data = {
+            "number": 7,
+            "title": "No description",
+            "body": None,
+            "state": "open",
+            "labels": [{"id": 1, "name": "question", "color": "d876e3", "default": True}],
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+            "html_url": "https://github.com/test/repo/issues/7",
+            "node_id": "I_kwDOA",
+            "comments": 3
+        }
+
+        issue = _parse_issue(issue_data)
+
+        self.assertEqual(issue.number, 7)
+        self.assertEqual(issue.body, "")
+        self.assertEqual(issue.node_id, "I_kwDOA")
+        self.assertEqual(issue.labels, (Label(name="question", color="d876e3"),))
+        self.assertEqual(issue.label_names, "question")
+        self.assertFalse(hasattr(issue, "comments"))
+
+        del issue_data["title"]
+        with self.assertRaises(ValueError):
+            _parse_issue(issue_data)
+
+    def test_parse_issues_skips_unparseable_issues(self):
+        """Test that one bad issue does not drop the rest of the list"""
+        good = {
+            "number": 1,
+            "title": "Good",
+            "body": "",
+            "state": "open",
+            "labels": [],
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+            "html_url": "https://github.com/test/repo/issues/1"
+        }
+
+        issues = _parse_issues([good, {"number": 2}])
+
+        self.assertEqual([issue.number for issue in issues], [1])
+        self.assertEqual(_parse_issues(None), [])
+
+    def test_encode_payload_matches_plain_json(self):
+        """Test that spliced payloads decode to the full MCP request"""
+        for params in ({}, {"issue_number": 3, "comment": 'Closing "as requested" }'}):
+            body = _encode_payload("github.close_issue", "test/repo", params)
+            self.assertEqual(json.loads(body), {
+                "method": "github.close_issue",
+                "params": {"owner": "test", "repo": "repo", **params}
+            })
+
+    def test_get_issues_by_label_revalidates_with_etag(self):
+        """Test that repeated label reads reuse the cached list on 304"""
+        issue = _make_issue(1, ["bug"], title="Cached Issue")
+        client = GitHubMCPClient()
+
+        with patch.object(client, "get_issues_by_label_conditional", AsyncMock(side_effect=[
+            ([issue], '"etag-1"'),
+            (None, '"etag-1"')
+        ])) as conditional:
+            first = asyncio.run(client.get_issues_by_label("test/repo", "bug"))
+            second = asyncio.run(client.get_issues_by_label("test/repo", "bug"))
+
+        self.assertIs(first, second)
+        conditional.assert_awaited_with("test/repo", "bug", '"etag-1"', False)
+
+    def test_get_issue_details_reuses_recent_results(self):
+        """Test that issue details are cached until the issue is changed"""
+        issue = _make_issue(5, title="Cached details")
+        response = MagicMock()
+        response.result.issue = issue
+        response.result.etag = '"etag-5"'
+        response.result.not_modified = False
+        client = GitHubMCPClient()
+
+        with patch.object(client, "_call", AsyncMock(side_effect=[response, {"success": True}, response])) as call:
+            first = asyncio.run(client.get_issue_details("test/repo", 5))
+            second = asyncio.run(client.get_issue_details("test/repo", 5))
+            self.assertEqual(call.await_count, 1)
+
+            asyncio.run(client.close_issue("test/repo", 5))
+            asyncio.run(client.get_issue_details("test/repo", 5))
+
+        self.assertIs(first, second)
+        self.assertEqual(call.await_count, 3)
+
+    def test_get_issue_details_reuses_results_without_etag(self):
+        """Test that the details TTL applies when the server sends no ETag"""
+        response = MagicMock()
+        response.result.issue = _make_issue(6, title="No ETag")
+        response.result.etag = None
+        response.result.not_modified = False
+        client = GitHubMCPClient()
+
+        with patch.object(client, "_call", AsyncMock(return_value=response)) as call:
+            first = asyncio.run(client.get_issue_details("test/repo", 6))
+            second = asyncio.run(client.get_issue_details("test/repo", 6))
+
+        self.assertIs(first, second)
+        self.assertEqual(call.await_count, 1)
+        self.assertNotIn("etag", call.await_args.args[2])
+
+    def test_get_issue_details_batch_keeps_order(self):
+        """Test that batched detail lookups return results in request order"""
+        client = GitHubMCPClient()
+
+        async def fake_details(repository, issue_number):
+            await asyncio.sleep(0.01 * (3 - issue_number))
+            return None if issue_number == 2 else issue_number
+
+        with patch.object(client, "get_issue_details", side_effect=fake_details):
+            results = asyncio.run(client.get_issue_details_batch("test/repo", [1, 2, 3]))
+
+        self.assertEqual(results, [1, None, 3])
+
+    def test_listed_issues_serve_detail_reads(self):
+        """Test that issues from a listing are reused as their details"""
+        client = GitHubMCPClient()
+        listing = {
+            "issues": [{
+                "number": 7,
+                "title": "Listed issue",
+                "body": "Full body",
+                "state": "open",
+                "labels": [{"name": "bug"}],
+                "created_at": "2024-01-01T00:00:00Z",
+                "updated_at": "2024-01-01T00:00:00Z",
+                "html_url": "https://github.com/test/repo/issues/7"
+            }],
+            "etag": '"etag-open"'
+        }
+
+        with patch.object(client, "_call", AsyncMock(return_value=listing)) as call:
+            issues = asyncio.run(client.get_all_open_issues("test/repo"))
+            details = asyncio.run(client.get_issue_details("test/repo", 7))
+
+        self.assertIs(details, issues[0])
+        self.assertEqual(call.await_count, 1)
+
+    def test_seeding_many_issues_keeps_list_etags(self):
+        """Test that a large listing does not evict the cached list ETags"""
+        client = GitHubMCPClient()
+        client._store_response(("github.list_issues", "test/repo", "bug"), '"etag-bug"', [])
+        issues = [_make_issue(number) for number in range(1, client.ETAG_CACHE_SIZE + 50)]
+
+        client._seed_issue_details("test/repo", issues)
+
+        self.assertEqual(client._cached_response(("github.list_issues", "test/repo", "bug"))[0], '"etag-bug"')
+        self.assertIs(client._cached_response(("github.get_issue", "test/repo", 1))[1], issues[0])
+
+    def test_validated_listing_decodes_response_bytes(self):
+        """Test that validated listings are parsed straight from the response body"""
+        client = GitHubMCPClient()
+        response = AsyncMock()
+        response.status = 200
+        response.read.return_value = json.dumps({"result": {
+            "issues": [{
+                "number": 8,
+                "title": "No description",
+                "body": None,
+                "state": "open",
+                "labels": [{"name": "bug", "color": "d73a4a"}],
+                "created_at": "2024-01-01T00:00:00Z",
+                "updated_at": "2024-01-01T00:00:00Z",
+                "html_url": "https://github.com/test/repo/issues/8"
+            }],
+            "etag": '"etag-open"'
+        }}).encode()
+        session = MagicMock()
+        session.post.return_value.__aenter__.return_value = response
+        session.post.return_value.__aexit__.return_value = False
+
+        with patch.object(client, "_get_session", AsyncMock(return_value=session)):
+            issues = asyncio.run(client.get_all_open_issues("test/repo", validate=True))
+
         self.assertEqual(len(issues), 1)
-        self.assertEqual(issues[0].title, "Test Issue")
-        self.assertEqual(issues[0].state, "open")
-    
-    @patch('aiohttp.ClientSession')
-    async def test_get_all_open_issues(self, mock_session):
-        """Test getting all open issues"""
-        # Mock response data
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.json = AsyncMock(return_value={
-            "result": {
-                "issues": [
-                    {
-                        "number": 123,
-                        "title": "Test Issue 1",
-                        "body": "Test body 1",
-                        "state": "open",
-                        "labels": [{"name": "bug"}],
-                        "created_at": "2024-01-01T00:00:00Z",
-                        "updated_at": "2024-01-01T00:00:00Z",
-                        "html_url": "https://github.com/test/repo/issues/123"
-                    },
-                    {
-                        "number": 124,
-                        "title": "Test Issue 2",
-                        "body": "Test body 2",
-                        "state": "open",
-                        "labels": [{"name": "feature"}],
-                        "created_at": "2024-01-01T00:00:00Z",
-                        "updated_at": "2024-01-01T00:00:00Z",
-                        "html_url": "https://github.com/test/repo/issues/124"
-                    }
-                ]
+        self.assertEqual(issues[0].body, "")
+        self.assertEqual(issues[0].labels[0].color, "d73a4a")
+
+    def test_iter_issues_by_label_follows_pages(self):
+        """Test that label iteration requests pages until a short one"""
+        def issue_data(number):
+            return {
+                "number": number,
+                "title": f"Issue {number}",
+                "body": "",
+                "state": "open",
+                "labels": [{"name": "bug"}],
+                "created_at": "2024-01-01T00:00:00Z",
+                "updated_at": "2024-01-01T00:00:00Z",
+                "html_url": f"https://github.com/test/repo/issues/{number}"
             }
-        })
-        
-        mock_session.return_value.__aenter__.return_value.post.return_value.__aenter__.return_value = mock_response
-        
-        client = GitHubMCPClient("http://localhost:3000")
-        issues = await client.get_all_open_issues("test/repo")
+
+        client = GitHubMCPClient()
+        pages = [
+            {"issues": [issue_data(1), issue_data(2)]},
+            {"issues": [issue_data(3)]}
+        ]
+
+        async def collect():
+            return [issue.number async for issue in client.iter_issues_by_label("test/repo", "bug", per_page=2)]
+
+        with patch.object(client, "_call", AsyncMock(side_effect=pages)) as call:
+            numbers = asyncio.run(collect())
+
+        self.assertEqual(numbers, [1, 2, 3])
+        self.assertEqual(call.await_count, 2)
+        self.assertEqual(call.await_args.args[2]["page"], 2)
+
+    def test_stream_issues_by_label_reads_ndjson(self):
+        """Test that streamed issues are parsed across chunk boundaries"""
+        lines = b"".join(json.dumps({
+            "number": number,
+            "title": f"Issue {number}",
+            "body": "",
+            "state": "open",
+            "labels": [{"name": "bug"}],
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+            "html_url": f"https://github.com/test/repo/issues/{number}"
+        }).encode() + b"\n" for number in (1, 2, 3))
+
+        # The final record may or may not be followed by a newline
+        for body in (lines, lines.rstrip(b"\n")):
+            with self.subTest(trailing_newline=body.endswith(b"\n")):
+                async def chunks():
+                    for start in range(0, len(body), 50):
+                        yield body[start:start + 50]
+
+                response = MagicMock()
+                response.status = 200
+                response.content.iter_any = chunks
+                session = MagicMock()
+                session.post.return_value.__aenter__ = AsyncMock(return_value=response)
+                session.post.return_value.__aexit__ = AsyncMock(return_value=False)
+                client = GitHubMCPClient()
+
+                async def collect():
+                    return [issue.number async for issue in client.stream_issues_by_label("test/repo", "bug")]
+
+                with patch.object(client, "_get_session", AsyncMock(return_value=session)):
+                    numbers = asyncio.run(collect())
+
+                self.assertEqual(numbers, [1, 2, 3])
+                self.assertTrue(session.post.call_args.args[0].endswith("/call/stream"))
+
+    def _mock_session(self, *statuses):
+        """Build a session whose posts answer with the given statuses in turn"""
+        responses = []
+        for status in statuses:
+            response = AsyncMock()
+            response.status = status
+            response.read.return_value = b'{"result": {"issues": [], "success": true}}'
+            response.content.read.return_value = b"Service Unavailable"
+            responses.append(response)
+
+        session = MagicMock()
+        session.post.return_value.__aenter__.side_effect = responses
+        session.post.return_value.__aexit__.return_value = False
+        return session
+
+    def test_reads_retry_gateway_errors(self):
+        """Test that idempotent reads are retried after a 503"""
+        client = GitHubMCPClient()
+        session = self._mock_session(503, 200)
+
+        with patch.object(client, "_get_session", AsyncMock(return_value=session)):
+            issues = asyncio.run(client.get_all_open_issues("test/repo"))
+
+        self.assertEqual(issues, [])
+        self.assertEqual(session.post.call_count, 2)
+
+    def test_writes_are_not_retried(self):
+        """Test that writes are sent once even after a 503"""
+        client = GitHubMCPClient()
+        session = self._mock_session(503, 200)
+
+        with patch.object(client, "_get_session", AsyncMock(return_value=session)):
+            created = asyncio.run(client.create_branch("test/repo", "feature"))
+
+        self.assertFalse(created)
+        self.assertEqual(session.post.call_count, 1)
+
+class TestGitHubMCPClientAsync(unittest.IsolatedAsyncioTestCase):
+    """Test the GitHub MCP Client's calls from inside a running event loop"""
+    
+    def _session_returning(self, result):
+        """Build a session whose posts answer with the given MCP result"""
+        response = AsyncMock()
+        response.status = 200
+        response.read.return_value = json.dumps({"result": result}).encode()
         
-        self.assertEqual(len(issues), 2)
-        self.assertEqual(issues[0].title, "Test Issue 1")
-        self.assertEqual(issues[1].title, "Test Issue 2")
-        self.assertEqual(issues[0].state, "open")
-        self.assertEqual(issues[1].state, "open")
+        session = MagicMock()
+        session.post.return_value.__aenter__.return_value = response
+        session.post.return_value.__aexit__.return_value = False
+        return session
+    
+    async def test_list_issues(self):
+        """Test getting issues by label and getting all open issues"""
+        cases = [
+            ("get_issues_by_label", ("test/repo", "bug"), [ISSUE_123]),
+            ("get_all_open_issues", ("test/repo",), [ISSUE_123, ISSUE_124]),
+        ]
+        for method, args, payload in cases:
+            with self.subTest(method=method):
+                session = self._session_returning({"issues": payload})
+                
+                client = GitHubMCPClient("http://localhost:3000")
+                with patch.object(client, "_get_session", AsyncMock(return_value=session)):
+                    issues = await getattr(client, method)(*args)
+                
+                self.assertEqual([issue.title for issue in issues], [data["title"] for data in payload])
+                self.assertTrue(all(issue.state == "open" for issue in issues))
 
 class TestCrewAgents(unittest.TestCase):
     """Test the Crew AI agents"""
+
+    @classmethod
+    def setUpClass(cls):
+        # Imported here so collecting this module does not load crewai
+        from src.crew_agents import GitHubIssueAgent, SeniorDeveloperAgent
+        cls.GitHubIssueAgent, cls.SeniorDeveloperAgent = GitHubIssueAgent, SeniorDeveloperAgent
     
     @patch('src.crew_agents.GitHubMCPClient')
-    async def test_github_issue_agent_creation(self, mock_mcp_client):
+    def test_github_issue_agent_creation(self, mock_mcp_client):
         """Test GitHub Issue Agent creation"""
-        mock_client = AsyncMock()
+        mock_client = _StubMCPClient()
         mock_mcp_client.return_value = mock_client
         
-        agent = GitHubIssueAgent(mock_client)
+        agent = self.GitHubIssueAgent(mock_client)
         
         # Test that the agent was created successfully
         self.assertIsNotNone(agent)
         self.assertEqual(agent.llm_model, "gpt-4")
     
     @patch('src.crew_agents.GitHubMCPClient')
-    async def test_senior_developer_agent_creation(self, mock_mcp_client):
+    def test_senior_developer_agent_creation(self, mock_mcp_client):
         """Test Senior Developer Agent creation"""
-        mock_client = AsyncMock()
+        mock_client = _StubMCPClient()
         mock_mcp_client.return_value = mock_client
         
-        agent = SeniorDeveloperAgent(mock_client)
+        agent = self.SeniorDeveloperAgent(mock_client)
         
         # Test that the agent was created successfully
         self.assertIsNotNone(agent)
@@ -143,7 +463,7 @@ class TestCrewAgents(unittest.TestCase):
     
     def test_senior_developer_code_extraction(self):
         """Test code block extraction functionality"""
-        agent = SeniorDeveloperAgent(AsyncMock())
+        agent = self.SeniorDeveloperAgent(_StubMCPClient())
         
         # Test markdown with code blocks
         test_text = """
@@ -168,12 +488,81 @@ class TestCrewAgents(unittest.TestCase):
         self.assertEqual(code_blocks[1]['language'], 'javascript')
         self.assertIn('def hello_world():', code_blocks[0]['code'])
         self.assertIn('function greet()', code_blocks[1]['code'])
-    
+
+    def test_senior_developer_code_extraction_returns_fresh_lists(self):
+        """Test that mutating extracted blocks does not affect later extractions"""
+        agent = self.SeniorDeveloperAgent(_StubMCPClient())
+
+        test_text = "```python\nprint('hi')\n```"
+
+        first = agent.extract_code_blocks(test_text)
+        first.clear()
+
+        self.assertEqual(agent.extract_code_blocks(test_text), [{'language': 'python', 'code': "print('hi')"}])
+        self.assertEqual(agent.extract_code_blocks("no code here"), [])
+
+    def test_senior_developer_issue_classification(self):
+        """Test classifying issues by the action they need"""
+        agent = self.SeniorDeveloperAgent(_StubMCPClient())
+
+        def issue(title, body):
+            return _make_issue(1, ["ai-task"], title=title, body=body)
+
+        self.assertEqual(agent._classify(issue("Implement user authentication API", "Use Flask.")), "code")
+        self.assertEqual(agent._classify(issue("Invalid test issue", "This should be closed.")), "invalid")
+        self.assertEqual(agent._classify(issue("Login page - DONE", "Resolved last week.")), "completed")
+        self.assertEqual(agent._classify(issue("Question", "Who owns the roadmap?")), "other")
+
+    def test_senior_developer_branch_name(self):
+        """Test branch names are slugged from the issue title"""
+        agent = self.SeniorDeveloperAgent(_StubMCPClient())
+
+        task = _make_issue(42, ["ai-task"], title="Fix: crash on   start!")
+
+        self.assertEqual(agent._branch_name(task), "ai-task-42-fix-crash-on-start")
+
+    def test_senior_developer_take_action_keeps_issue_order(self):
+        """Test that concurrent issue processing reports issues in order"""
+        mock_client = AsyncMock()
+        agent = self.SeniorDeveloperAgent(mock_client)
+
+        tasks = [
+            _make_issue(number, ["ai-task"], title=f"Invalid issue {number}", body="This should be closed.")
+            for number in (1, 2, 3)
+        ]
+
+        summary = asyncio.run(agent._take_action_on_issues("test/repo", tasks, "analysis"))
+
+        self.assertEqual(mock_client.close_issue.await_count, 3)
+        mock_client.add_issue_comments.assert_not_awaited()
+        self.assertLess(summary.index("#1"), summary.index("#2"))
+        self.assertLess(summary.index("#2"), summary.index("#3"))
+
+    def test_senior_developer_take_action_batches_comments(self):
+        """Test that issue comments are posted in a single request"""
+        mock_client = AsyncMock()
+        mock_client.add_issue_comments.return_value = [True, False]
+        agent = self.SeniorDeveloperAgent(mock_client)
+
+        tasks = [
+            _make_issue(number, ["ai-task"], title=f"Question {number}", body="What does this setting do?")
+            for number in (1, 2)
+        ]
+
+        summary = asyncio.run(agent._take_action_on_issues("test/repo", tasks, "analysis"))
+
+        mock_client.add_issue_comments.assert_awaited_once()
+        comments = mock_client.add_issue_comments.await_args.args[1]
+        self.assertEqual([task.number for task, _ in comments], [1, 2])
+        mock_client.add_issue_comment.assert_not_awaited()
+        self.assertIn("Added analysis comment to issue #1", summary)
+        self.assertIn("Failed to add comment to issue #2", summary)
+
     @patch('builtins.open', create=True)
     @patch('os.makedirs')
     def test_senior_developer_save_implementations(self, mock_makedirs, mock_open):
         """Test saving implementations functionality"""
-        agent = SeniorDeveloperAgent(AsyncMock())
+        agent = self.SeniorDeveloperAgent(_StubMCPClient())
         
         # Mock file operations
         mock_file = AsyncMock()
@@ -187,7 +576,7 @@ class TestCrewAgents(unittest.TestCase):
         ```
         """
         
-        save_result = agent.save_implementations(result_text)
+        save_result = asyncio.run(agent.save_implementations(result_text))
         
         # Check that the directory was created
         mock_makedirs.assert_called_once_with("ai_task_implementations", exist_ok=True)
@@ -196,6 +585,166 @@ class TestCrewAgents(unittest.TestCase):
         self.assertIn("Saved", save_result)
         self.assertIn("ai_task_implementations", save_result)
 
+    @patch('builtins.open', create=True)
+    @patch('os.makedirs')
+    def test_senior_developer_save_implementations_uses_given_blocks(self, mock_makedirs, mock_open):
+        """Test that already parsed code blocks are saved without parsing the result again"""
+        agent = self.SeniorDeveloperAgent(_StubMCPClient())
+        code_blocks = ({'language': 'python', 'code': 'print("hi")'},)
+
+        with patch.object(agent, 'extract_code_blocks') as extract:
+            save_result = asyncio.run(agent.save_implementations("result", code_blocks=code_blocks))
+
+        extract.assert_not_called()
+        self.assertIn("ai_task_implementation_1.py", save_result)
+
+class TestLLMResponseCache(unittest.TestCase):
+    """Test the Crew AI response cache"""
+
+    @classmethod
+    def setUpClass(cls):
+        # Imported here so collecting this module does not load crewai
+        from src.crew_agents import LLMResponseCache
+        cls.LLMResponseCache = LLMResponseCache
+
+    def _issue(self, number, updated_at="2024-01-01T00:00:00Z"):
+        return _make_issue(number, title=f"Issue {number}", updated_at=updated_at)
+
+    def test_key_ignores_issue_order_and_tracks_updates(self):
+        """Test that keys depend on issue contents, not ordering"""
+        key = self.LLMResponseCache.make_key("gpt-4", "test/repo", "bug", [self._issue(1), self._issue(2)])
+
+        self.assertEqual(key, self.LLMResponseCache.make_key("gpt-4", "test/repo", "bug", [self._issue(2), self._issue(1)]))
+        self.assertNotEqual(key, self.LLMResponseCache.make_key("gpt-4", "test/repo", "bug", [self._issue(1), self._issue(2, "2024-02-01T00:00:00Z")]))
+        self.assertNotEqual(key, self.LLMResponseCache.make_key("gpt-3.5-turbo", "test/repo", "bug", [self._issue(1), self._issue(2)]))
+
+    def test_key_separates_crews_and_open_totals(self):
+        """Test that the analysis and AI task crews never share results"""
+        issues = [self._issue(1)]
+        analysis = self.LLMResponseCache.make_key("gpt-4", "test/repo", "ai-task", issues, crew="analysis", total_open=10)
+
+        self.assertNotEqual(analysis, self.LLMResponseCache.make_key("gpt-4", "test/repo", "ai-task", issues, crew="ai_task"))
+        self.assertNotEqual(analysis, self.LLMResponseCache.make_key("gpt-4", "test/repo", "ai-task", issues, crew="analysis", total_open=11))
+
+    def test_get_and_expiry(self):
+        """Test cache hits, misses and TTL expiry"""
+        cache = self.LLMResponseCache()
+        self.assertIsNone(cache.get("key"))
+
+        cache.set("key", "result")
+        self.assertEqual(cache.get("key"), "result")
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        expired = self.LLMResponseCache(ttl=0)
+        expired.set("key", "result")
+        self.assertIsNone(expired.get("key"))
+
+    def test_evicts_least_recently_used(self):
+        """Test that the cache stays within max_entries"""
+        cache = self.LLMResponseCache(max_entries=2)
+        cache.set("a", "A")
+        cache.set("b", "B")
+        cache.get("a")
+        cache.set("c", "C")
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual((cache.get("a"), cache.get("c")), ("A", "C"))
+
+class TestIssueCache(unittest.TestCase):
+    """Test the per-label issue cache"""
+
+    @classmethod
+    def setUpClass(cls):
+        # Imported here so collecting this module does not load crewai
+        from src.crew_agents import IssueCache
+        cls.IssueCache = IssueCache
+
+    def setUp(self):
+        self.issue = _make_issue(1, ["bug"], title="Cached Issue")
+
+    def test_fresh_results_skip_the_client(self):
+        """Test that results within the TTL are served from the cache"""
+        mock_client = AsyncMock()
+        mock_client.get_issues_by_label_conditional.return_value = ([self.issue], '"etag-1"')
+        cache = self.IssueCache()
+
+        first = asyncio.run(cache.get_issues_by_label(mock_client, "test/repo", "bug"))
+        second = asyncio.run(cache.get_issues_by_label(mock_client, "test/repo", "bug"))
+
+        self.assertEqual(first, [self.issue])
+        self.assertIs(first, second)
+        self.assertEqual(mock_client.get_issues_by_label_conditional.await_count, 1)
+
+    def test_stale_results_are_revalidated_with_etag(self):
+        """Test that a 304 response reuses the cached issues"""
+        mock_client = AsyncMock()
+        mock_client.get_issues_by_label_conditional.side_effect = [
+            ([self.issue], '"etag-1"'),
+            (None, '"etag-1"')
+        ]
+        cache = self.IssueCache(ttl=0)
+
+        asyncio.run(cache.get_issues_by_label(mock_client, "test/repo", "bug"))
+        issues = asyncio.run(cache.get_issues_by_label(mock_client, "test/repo", "bug"))
+
+        self.assertEqual(issues, [self.issue])
+        mock_client.get_issues_by_label_conditional.assert_awaited_with("test/repo", "bug", '"etag-1"')
+
+    def test_concurrent_callers_share_one_fetch(self):
+        """Test that simultaneous requests for the same label fetch once"""
+        mock_client = AsyncMock()
+        mock_client.get_issues_by_label_conditional.return_value = ([self.issue], '"etag-1"')
+        cache = self.IssueCache()
+
+        async def fetch_twice():
+            return await asyncio.gather(
+                cache.get_issues_by_label(mock_client, "test/repo", "bug"),
+                cache.get_issues_by_label(mock_client, "test/repo", "bug")
+            )
+
+        first, second = asyncio.run(fetch_twice())
+
+        self.assertIs(first, second)
+        self.assertEqual(mock_client.get_issues_by_label_conditional.await_count, 1)
+        self.assertEqual(cache._locks, {})
+
+    def test_invalidate_forces_a_fresh_fetch(self):
+        """Test that issues acted on are not served from the cache again"""
+        mock_client = AsyncMock()
+        mock_client.get_issues_by_label_conditional.return_value = ([self.issue], '"etag-1"')
+        cache = self.IssueCache()
+
+        asyncio.run(cache.get_issues_by_label(mock_client, "test/repo", "bug"))
+        cache.invalidate("test/repo", "bug")
+        asyncio.run(cache.get_issues_by_label(mock_client, "test/repo", "bug"))
+
+        self.assertEqual(mock_client.get_issues_by_label_conditional.await_count, 2)
+        mock_client.get_issues_by_label_conditional.assert_awaited_with("test/repo", "bug", None)
+
+class TestRateLimiter(unittest.TestCase):
+    """Test the write rate limiter"""
+
+    @classmethod
+    def setUpClass(cls):
+        # Imported here so collecting this module does not load crewai
+        from src.crew_agents import RateLimiter
+        cls.RateLimiter = RateLimiter
+
+    def test_burst_then_throttle(self):
+        """Test that calls beyond the burst wait for tokens to refill"""
+        limiter = self.RateLimiter(rate=20, burst=2)
+
+        async def acquire_three():
+            start = time.monotonic()
+            for _ in range(3):
+                async with limiter:
+                    pass
+            return time.monotonic() - start
+
+        elapsed = asyncio.run(acquire_three())
+
+        self.assertGreaterEqual(elapsed, 0.04)
+
 class TestIntegration(unittest.TestCase):
     """Integration tests"""
     
@@ -210,23 +759,4 @@ class TestIntegration(unittest.TestCase):
             self.assertTrue(len(var) > 0)
 
 if __name__ == "__main__":
-    # Run async tests
-    async def run_async_tests():
-        # Create test suite
-        loader = unittest.TestLoader()
-        suite = unittest.TestSuite()
-        
-        # Add tests
-        suite.addTests(loader.loadTestsFromTestCase(TestGitHubMCPClient))
-        suite.addTests(loader.loadTestsFromTestCase(TestCrewAgents))
-        suite.addTests(loader.loadTestsFromTestCase(TestIntegration))
-        
-        # Run tests
-        runner = unittest.TextTestRunner(verbosity=2)
-        result = runner.run(suite)
-        
-        return result.wasSuccessful()
-    
-    # Run the async tests
-    success = asyncio.run(run_async_tests())
-    sys.exit(0 if success else 1) 
\ No newline at end of file
+    unittest.main(verbosity=2)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests for the GitHub MCP server's request handling
+"""
+
+import unittest
+import asyncio
+import json
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add the parent directory to the path when run directly; under pytest
+# conftest.py has already done this
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from src.mcp_server import GitHubMCPServer, MCPHandler
+
+ISSUES_URL = "https://api.github.com/repos/test/repo/issues"
+
+def _response(status, body=None, headers=None):
+    """Build a GitHub response with a JSON body"""
+    response = MagicMock()
+    response.status = status
+    response.headers = headers or {}
+    response.read = AsyncMock(return_value=json.dumps(body).encode() if body is not None else b"")
+    response.content.read = AsyncMock(return_value=b"")
+    return response
+
+class TestGitHubMCPServer(unittest.IsolatedAsyncioTestCase):
+    """Test the GitHub MCP server against a stubbed GitHub session"""
+
+    def _server(self, *responses):
+        """Build a server whose GitHub requests answer with the given responses in turn"""
+        server = GitHubMCPServer("test_token")
+        server.session = MagicMock(closed=False)
+        server.session.request = AsyncMock(side_effect=list(responses))
+        return server
+
+    async def test_rate_limited_request_waits_for_retry_after(self):
+        """Test that a 429 is retried, even for a POST, after Retry-After seconds"""
+        server = self._server(_response(429, headers={"Retry-After": "2"}), _response(201))
+
+        with patch("src.mcp_server.asyncio.sleep", AsyncMock()) as sleep:
+            async with server._request("POST", ISSUES_URL, json={}) as response:
+                status = response.status
+
+        self.assertEqual(status, 201)
+        self.assertEqual(server.session.request.await_count, 2)
+        sleep.assert_awaited_once_with(2.0)
+
+    async def test_post_is_not_retried_on_server_error(self):
+        """Test that a POST that may have been applied is not sent twice"""
+        server = self._server(_response(503), _response(201))
+
+        async with server._request("POST", ISSUES_URL, json={}) as response:
+            status = response.status
+
+        self.assertEqual(status, 503)
+        self.assertEqual(server.session.request.await_count, 1)
+
+    async def test_concurrent_reads_share_one_request(self):
+        """Test that simultaneous reads of a resource make one GitHub request"""
+        server = self._server(_response(200, [{"number": 1}], {"ETag": '"etag-1"'}))
+
+        first, second = await asyncio.gather(
+            server._conditional_get(ISSUES_URL, {"state": "open"}),
+            server._conditional_get(ISSUES_URL, {"state": "open"})
+        )
+
+        self.assertEqual(first, (200, [{"number": 1}], '"etag-1"'))
+        self.assertEqual(first, second)
+        self.assertEqual(server.session.request.await_count, 1)
+
+    async def test_not_modified_reuses_cached_body(self):
+        """Test that a 304 from GitHub is answered from the cached body"""
+        server = self._server(
+            _response(200, [{"number": 1}], {"ETag": '"etag-1"'}),
+            _response(304)
+        )
+
+        await server._conditional_get(ISSUES_URL)
+        status, body, etag = await server._conditional_get(ISSUES_URL)
+
+        self.assertEqual((status, body, etag), (200, [{"number": 1}], '"etag-1"'))
+        headers = server.session.request.await_args.kwargs["headers"]
+        self.assertEqual(headers["If-None-Match"], '"etag-1"')
+
+        # A caller already holding the current ETag is told it is unchanged
+        server.session.request.side_effect = [_response(304)]
+        self.assertEqual(await server._conditional_get(ISSUES_URL, etag='"etag-1"'), (304, None, '"etag-1"'))
+
+    async def test_comments_without_node_id_fall_back_to_rest(self):
+        """Test that only comments with a node_id go into the GraphQL batch"""
+        server = self._server(_response(200, {"data": {"c0": {"clientMutationId": None}}}))
+        server.add_issue_comment = AsyncMock(return_value=True)
+
+        results = await server.add_issue_comments("test", "repo", [
+            {"issue_number": 1, "comment": "Batched", "node_id": "I_1"},
+            {"issue_number": 2, "comment": "Unbatched"}
+        ])
+
+        self.assertEqual(results, [True, True])
+        server.add_issue_comment.assert_awaited_once_with("test", "repo", 2, "Unbatched")
+        graphql = server.session.request.await_args
+        self.assertEqual(graphql.args, ("POST", "https://api.github.com/graphql"))
+        self.assertEqual(graphql.kwargs["json"]["variables"], {"subject0": "I_1", "body0": "Batched"})
+
+class TestMCPHandler(unittest.IsolatedAsyncioTestCase):
+    """Test the MCP HTTP handlers"""
+
+    async def test_stream_writes_one_issue_per_line(self):
+        """Test that streamed issues are framed as newline-delimited JSON"""
+        async def pages(**kwargs):
+            yield [{"number": 1}, {"number": 2}]
+            yield [{"number": 3}]
+
+        github_server = MagicMock()
+        github_server.iter_issue_pages = pages
+        handler = MCPHandler(github_server)
+
+        request = MagicMock()
+        request.read = AsyncMock(return_value=json.dumps({
+            "method": "github.list_issues",
+            "params": {"owner": "test", "repo": "repo", "labels": ["bug"]}
+        }).encode())
+
+        with patch("src.mcp_server.web.StreamResponse") as stream_class:
+            stream = stream_class.return_value
+            stream.prepare = AsyncMock()
+            stream.write = AsyncMock()
+            stream.write_eof = AsyncMock()
+
+            await handler.handle_stream(request)
+
+        body = b"".join(call.args[0] for call in stream.write.await_args_list)
+        self.assertTrue(body.endswith(b"\n"))
+        self.assertEqual([json.loads(line) for line in body.splitlines()],
+                         [{"number": 1}, {"number": 2}, {"number": 3}])
+        stream.write_eof.assert_awaited_once()
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)